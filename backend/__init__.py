@@ -0,0 +1,7 @@
+"""
+QualGent Job Orchestrator backend package
+
+Run from the repository root so `backend` and `shared` resolve as packages:
+    python -m backend.app
+    gunicorn -c backend/gunicorn.conf.py backend.app:app
+"""
@@ -5,302 +5,504 @@ This Flask application provides REST API endpoints for job submission,
 status checking, and worker management.
 """
 
-import os
-import sys
+import math
+import time
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
 
-from flask import Flask, request, jsonify, Blueprint
+import orjson
+from flask import Flask, Response, request, jsonify, Blueprint, abort
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-
-# Add parent directory to path to import shared modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import BaseConverter
+from werkzeug.serving import WSGIRequestHandler
 
 from shared import (
-    JobStatus, JobTarget, JobPriority, JobPayload, Job, JobGroup, Worker,
-    generate_job_id, generate_group_id, generate_worker_id
+    JobStatus, JobTarget, JobPayload, Job, Worker,
+    generate_job_id, generate_worker_id
 )
-from job_store import JobStore
-from redis_job_store import RedisJobStore
-from scheduler import JobScheduler
-from config import get_config
+from .job_store import JobStore, TERMINAL_STATES
+from .redis_job_store import RedisJobStore, create_connection_pool
+from .scheduler import JobScheduler
+from .config import get_config
 
 # Configure logging using config
 config = get_config()
 config.configure_logging()
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson
+    
+    Request bodies (`request.get_json()`) are parsed and `jsonify` responses
+    encoded in C, rather than by the stdlib json module.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+
+class JobIdConverter(BaseConverter):
+    """Matches the UUID4 strings produced by generate_job_id"""
+    regex = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+
+
+class WorkerIdConverter(BaseConverter):
+    """Matches the ids produced by generate_worker_id"""
+    regex = r'worker-[0-9a-f]{8}'
+
+
+# Malformed ids fail URL matching and 404 before any store lookup. These must
+# be registered before the blueprints so their rules can resolve them.
+app.url_map.converters['job_id'] = JobIdConverter
+app.url_map.converters['worker_id'] = WorkerIdConverter
+
 # --- Blueprint setup ---
 jobs_bp = Blueprint('jobs', __name__)
 workers_bp = Blueprint('workers', __name__)
 
+REQUIRED_JOB_FIELDS = frozenset({'org_id', 'app_version_id', 'test_path'})
+REQUIRED_WORKER_FIELDS = frozenset({'name', 'target_types'})
+
 def validate_required_fields(data, required_fields):
-    missing = [f for f in required_fields if f not in data]
+    if not isinstance(data, dict):
+        return False, "Expected a JSON object"
+    missing = required_fields.difference(data)
     if missing:
-        return False, f"Missing required field(s): {', '.join(missing)}"
+        return False, f"Missing required field(s): {', '.join(sorted(missing))}"
     return True, None
 
+# Plain dict lookups for enum values coming off the wire; calling the Enum
+# class goes through EnumMeta.__call__ on every request
+_STATUS_BY_VALUE = {s.value: s for s in JobStatus}
+_TARGET_BY_VALUE = {t.value: t for t in JobTarget}
+
+def parse_enum(members, value, name):
+    """Look up an enum member by its wire value, aborting with a 400 if unknown"""
+    try:
+        return members[value]
+    except (KeyError, TypeError):
+        abort(400, description=f"Invalid {name}: {value!r}")
+
 def error_response(message, code=400):
     return jsonify({"error": message}), code
 
-# Move job routes to jobs_bp
+def ojsonify(obj):
+    """Build a JSON response with orjson, for endpoints returning job records"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+# Records serialized per chunk when streaming a listing
+STREAM_BATCH_SIZE = 500
+
+def _json_list_chunks(key, items):
+    """Yield `{"<key>": [...], "count": N}` a batch of records at a time"""
+    yield b'{"' + key.encode() + b'":['
+    for start in range(0, len(items), STREAM_BATCH_SIZE):
+        batch = [item.to_dict() for item in items[start:start + STREAM_BATCH_SIZE]]
+        # Strip the brackets orjson puts around the batch and splice it in
+        yield (b',' if start else b'') + orjson.dumps(batch)[1:-1]
+    yield b'],"count":' + str(len(items)).encode() + b'}'
+
+def stream_json_list(key, items):
+    """Stream a listing so only one batch of serialized records is held at once"""
+    return Response(_json_list_chunks(key, items), mimetype='application/json')
+
+# Errors are turned into JSON responses here rather than in every route
+@app.errorhandler(HTTPException)
+def handle_http_error(e):
+    """Return aborts (404s, malformed JSON bodies, ...) as JSON"""
+    return error_response(e.description, e.code)
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Log and report anything the routes did not handle"""
+    logger.exception("Unhandled error on %s %s", request.method, request.path)
+    return error_response(str(e), 500)
+
 @jobs_bp.route('/jobs', methods=['POST'])
 def submit_job():
     """Submit a new test job"""
+    data = request.get_json()
+    
+    ok, err = validate_required_fields(data, REQUIRED_JOB_FIELDS)
+    if not ok:
+        return error_response(err, 400)
+    
+    # Create job payload
     try:
-        data = request.get_json()
-        
-        ok, err = validate_required_fields(data, ['org_id', 'app_version_id', 'test_path'])
-        if not ok:
-            return error_response(err, 400)
-        
-        # Create job payload
         payload = JobPayload.from_dict(data)
-        
-        # Generate job ID and create job
-        job_id = generate_job_id()
-        job = Job(job_id=job_id, payload=payload)
-        
-        # Store job and add to scheduler
-        job_store.add_job(job)
-        scheduler.queue_job(job)
-        
-        return jsonify({
-            "job_id": job_id,
-            "status": job.status.value,
-            "message": "Job submitted successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    except ValueError as e:
+        return error_response(str(e), 400)
+    
+    # Generate job ID and create job
+    job_id = generate_job_id()
+    job = Job(job_id=job_id, payload=payload)
+    
+    # Store job and add to scheduler
+    job_store.add_job(job)
+    scheduler.queue_job(job)
+    
+    return jsonify({
+        "job_id": job_id,
+        "status": job.status.value,
+        "message": "Job submitted successfully"
+    }), 201
+
 
+@jobs_bp.route('/jobs/bulk', methods=['POST'])
+def bulk_submit_job():
+    """Submit many test jobs in one request (JSON array or JSON Lines body)"""
+    if request.is_json:
+        items = request.get_json()
+    else:
+        try:
+            items = [orjson.loads(line) for line in request.get_data().splitlines()
+                     if line.strip()]
+        except orjson.JSONDecodeError as e:
+            return error_response(f"Invalid JSON Lines body: {e}", 400)
+    
+    if not isinstance(items, list) or not items:
+        return error_response("Expected a non-empty list of jobs", 400)
+    
+    # Validate every payload before touching the store so a bad entry
+    # rejects the whole batch
+    payloads = []
+    for index, data in enumerate(items):
+        ok, err = validate_required_fields(data, REQUIRED_JOB_FIELDS)
+        if not ok:
+            return error_response(f"Job {index}: {err}", 400)
+        try:
+            payloads.append(JobPayload.from_dict(data))
+        except ValueError as e:
+            return error_response(f"Job {index}: {e}", 400)
+    
+    jobs = [Job(job_id=generate_job_id(), payload=payload) for payload in payloads]
+    
+    # One store write and one scheduler pass for the whole batch
+    job_store.add_jobs(jobs)
+    scheduler.queue_jobs(jobs)
+    
+    return ojsonify({
+        "jobs": [{"job_id": job.job_id, "status": job.status._value_} for job in jobs],
+        "count": len(jobs),
+        "message": "Jobs submitted successfully"
+    }), 201
 
-@jobs_bp.route('/jobs/<job_id>', methods=['GET'])
+
+@jobs_bp.route('/jobs/<job_id:job_id>', methods=['GET'])
 def get_job_status(job_id: str):
     """Get job status and details"""
-    try:
-        job = job_store.get_job(job_id)
-        if not job:
-            return jsonify({"error": "Job not found"}), 404
-        
-        return jsonify(job.to_dict()), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    job = job_store.get_job(job_id)
+    if not job:
+        abort(404, description="Job not found")
+    
+    # Pollers that send back the ETag get an empty 304 while nothing changed
+    response = ojsonify(job.to_dict())
+    response.add_etag()
+    return response.make_conditional(request)
 
 
-@jobs_bp.route('/jobs/<job_id>', methods=['PUT'])
+@jobs_bp.route('/jobs/<job_id:job_id>', methods=['PUT'])
 def update_job_status(job_id: str):
     """Update job status (used by workers)"""
-    try:
-        data = request.get_json()
-        job = job_store.get_job(job_id)
-        
-        if not job:
-            return jsonify({"error": "Job not found"}), 404
-        
-        # Update job status and timestamps
-        if 'status' in data:
-            job.status = JobStatus(data['status'])
-            job.updated_at = datetime.utcnow()
-            
-            if job.status == JobStatus.RUNNING and not job.started_at:
-                job.started_at = datetime.utcnow()
-            elif job.status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                job.completed_at = datetime.utcnow()
-        
-        if 'worker_id' in data:
-            job.worker_id = data['worker_id']
-            
-        if 'result' in data:
-            job.result = data['result']
-            
-        if 'error_message' in data:
-            job.error_message = data['error_message']
-        
-        job_store.update_job(job)
+    data = request.get_json()
+    job = job_store.get_job(job_id)
+    
+    if not job:
+        abort(404, description="Job not found")
+    if not isinstance(data, dict):
+        return error_response("Expected a JSON object", 400)
+    
+    # Only the attributes touched here are written back
+    fields = [key for key in ('worker_id', 'result', 'error_message') if key in data]
+    
+    # Update job status and timestamps, all stamped with the same instant
+    if 'status' in data:
+        fields += ['status', 'updated_at', 'started_at', 'completed_at']
+        now = datetime.utcnow()
+        job.status = parse_enum(_STATUS_BY_VALUE, data['status'], "status")
+        job.updated_at = now
+        
+        if job.status == JobStatus.RUNNING and not job.started_at:
+            job.started_at = now
+        elif job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            job.completed_at = now
+    
+    if 'worker_id' in data:
+        job.worker_id = data['worker_id']
         
-        return jsonify(job.to_dict()), 200
+    if 'result' in data:
+        job.result = data['result']
         
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    if 'error_message' in data:
+        job.error_message = data['error_message']
+    
+    job_store.update_job(job, fields=fields)
+    if 'status' in data:
+        scheduler.notify_job_changed()
+    
+    return ojsonify(job.to_dict()), 200
+
+
+def _job_event_stream(job_id, job):
+    """Yield an SSE `status` event per status change until the job finishes"""
+    deadline = time.monotonic() + config.JOB_EVENTS_MAX_DURATION
+    while True:
+        yield b'event: status\ndata: ' + orjson.dumps(job.to_dict()) + b'\n\n'
+        if job.status in TERMINAL_STATES:
+            return
+        
+        status = job.status
+        while job.status == status:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            job = scheduler.wait_for_job_change(
+                job_id, status, timeout=min(remaining, config.JOB_EVENTS_KEEPALIVE))
+            if job is None:
+                yield b'event: deleted\ndata: {}\n\n'
+                return
+            if job.status == status:
+                yield b': keep-alive\n\n'
+
+
+# Open event streams in this process, capped so streams cannot take every
+# request thread away from worker heartbeats
+_job_event_slots = threading.BoundedSemaphore(config.JOB_EVENTS_MAX_STREAMS)
+
+
+@jobs_bp.route('/jobs/<job_id:job_id>/events', methods=['GET'])
+def job_events(job_id: str):
+    """Stream a job's status changes as server-sent events
+    
+    Each `status` event carries the job as JSON. The stream closes once the
+    job reaches a terminal state, or after JOB_EVENTS_MAX_DURATION seconds,
+    after which clients reconnect. When JOB_EVENTS_MAX_STREAMS streams are
+    already open this returns 503 and clients poll GET /jobs/<id> instead.
+    """
+    job = job_store.get_job(job_id)
+    if not job:
+        abort(404, description="Job not found")
+    
+    if not _job_event_slots.acquire(blocking=False):
+        abort(503, description="Too many open event streams; poll the job instead")
+    response = Response(_job_event_stream(job_id, job), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # Runs when the server closes the response, even if the client went away
+    # before the stream started
+    response.call_on_close(_job_event_slots.release)
+    return response
 
 
 @jobs_bp.route('/jobs', methods=['GET'])
 def list_jobs():
-    """List jobs with optional filtering"""
-    try:
-        org_id = request.args.get('org_id')
-        status = request.args.get('status')
-        app_version_id = request.args.get('app_version_id')
-        
-        jobs = job_store.list_jobs(
-            org_id=org_id,
-            status=JobStatus(status) if status else None,
-            app_version_id=app_version_id
-        )
-        
-        return jsonify({
-            "jobs": [job.to_dict() for job in jobs],
-            "count": len(jobs)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """List jobs with optional filtering
+    
+    Pass `limit` and `offset` to fetch one page; the store applies them, so
+    only that page is loaded and serialized.
+    """
+    org_id = request.args.get('org_id')
+    status = request.args.get('status')
+    app_version_id = request.args.get('app_version_id')
+    target = request.args.get('target')
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', 0, type=int)
+    if offset < 0 or (limit is not None and limit < 0):
+        abort(400, description="limit and offset must not be negative")
+    
+    jobs = job_store.list_jobs(
+        org_id=org_id,
+        status=parse_enum(_STATUS_BY_VALUE, status, "status") if status else None,
+        app_version_id=app_version_id,
+        offset=offset,
+        limit=limit,
+        target=parse_enum(_TARGET_BY_VALUE, target, "target") if target else None
+    )
+    
+    return stream_json_list("jobs", jobs), 200
 
 
 @app.route('/groups', methods=['GET'])
 def list_job_groups():
     """List job groups"""
-    try:
-        org_id = request.args.get('org_id')
-        groups = job_store.list_groups(org_id=org_id)
-        
-        return jsonify({
-            "groups": [group.to_dict() for group in groups],
-            "count": len(groups)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    org_id = request.args.get('org_id')
+    groups = job_store.list_groups(org_id=org_id)
+    
+    return stream_json_list("groups", groups), 200
 
 
-# Move worker routes to workers_bp
 @workers_bp.route('/workers', methods=['POST'])
 def register_worker():
     """Register a new worker"""
-    try:
-        data = request.get_json()
-        
-        required_fields = ['name', 'target_types']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({"error": f"Missing required field: {field}"}), 400
-        
-        worker_id = generate_worker_id()
-        worker = Worker(
-            worker_id=worker_id,
-            name=data['name'],
-            target_types=[JobTarget(t) for t in data['target_types']],
-            metadata=data.get('metadata', {})
-        )
-        
-        job_store.add_worker(worker)
-        
-        return jsonify({
-            "worker_id": worker_id,
-            "message": "Worker registered successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    data = request.get_json()
+    
+    ok, err = validate_required_fields(data, REQUIRED_WORKER_FIELDS)
+    if not ok:
+        return error_response(err, 400)
+    if not isinstance(data['target_types'], list):
+        return error_response("target_types must be a list", 400)
+    
+    worker_id = generate_worker_id()
+    worker = Worker(
+        worker_id=worker_id,
+        name=data['name'],
+        # Repeated targets are dropped, keeping the order given
+        target_types=[parse_enum(_TARGET_BY_VALUE, t, "target type")
+                      for t in dict.fromkeys(data['target_types'])],
+        metadata=data.get('metadata', {})
+    )
+    
+    job_store.add_worker(worker)
+    # Groups waiting for a worker can be assigned right away
+    scheduler.notify()
+    
+    return jsonify({
+        "worker_id": worker_id,
+        "message": "Worker registered successfully"
+    }), 201
 
 
 @workers_bp.route('/workers', methods=['GET'])
 def list_workers():
     """List all workers"""
-    try:
-        workers = job_store.list_workers()
-        return jsonify({
-            "workers": [worker.to_dict() for worker in workers],
-            "count": len(workers)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    workers = job_store.list_workers()
+    return stream_json_list("workers", workers), 200
+
 
+# Heartbeats long-polling in this process, capped like event streams so idle
+# workers cannot hold every request thread
+_heartbeat_wait_slots = threading.BoundedSemaphore(config.HEARTBEAT_MAX_WAITERS)
 
-@workers_bp.route('/workers/<worker_id>/heartbeat', methods=['POST'])
+
+@workers_bp.route('/workers/<worker_id:worker_id>/heartbeat', methods=['POST'])
 def worker_heartbeat(worker_id: str):
-    """Worker heartbeat endpoint"""
-    try:
-        worker = job_store.get_worker(worker_id)
-        if not worker:
-            return jsonify({"error": "Worker not found"}), 404
-        
-        worker.last_heartbeat = datetime.utcnow()
-        job_store.update_worker(worker)
-        
-        # Get next job for worker if available
+    """Worker heartbeat endpoint
+    
+    Pass `?wait=<seconds>` to long-poll: if no job is ready the request
+    blocks until one is assigned or the wait elapses. When
+    HEARTBEAT_MAX_WAITERS heartbeats are already waiting, this one answers
+    at once as if no wait was given.
+    """
+    # nan would survive the clamp below and make the wait never time out
+    wait = request.args.get('wait', 0, type=float)
+    if not math.isfinite(wait):
+        abort(400, description="wait must be a finite number of seconds")
+    wait = min(max(wait, 0), config.HEARTBEAT_MAX_WAIT)
+    
+    worker = job_store.get_worker(worker_id)
+    if not worker:
+        abort(404, description="Worker not found")
+    
+    worker.last_heartbeat = datetime.utcnow()
+    job_store.update_worker(worker, fields=("last_heartbeat",))
+    
+    # Get next job for worker if available
+    if wait and _heartbeat_wait_slots.acquire(blocking=False):
+        try:
+            next_job = scheduler.wait_for_work(worker, timeout=wait)
+        finally:
+            _heartbeat_wait_slots.release()
+    else:
         next_job = scheduler.get_next_job_for_worker(worker)
-        
-        response = {"status": "ok"}
-        if next_job:
-            response["next_job"] = next_job.to_dict()
-        
-        return jsonify(response), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    
+    response = {"status": "ok"}
+    if next_job:
+        response["next_job"] = next_job.to_dict()
+    
+    return ojsonify(response), 200
+
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Liveness check used by the CLI and monitoring"""
+    return jsonify({
+        "status": "healthy",
+        "version": "1.0.0",
+        "timestamp": datetime.utcnow().isoformat()
+    }), 200
+
+
+# Encoded /stats body shared by all requests until it expires, so dashboards
+# polling concurrently trigger one computation per TTL
+_stats_cache_lock = threading.Lock()
+_stats_cache = {"body": None, "expires_at": 0.0}
 
 
 @app.route('/stats', methods=['GET'])
 def get_stats():
     """Get system statistics"""
-    try:
-        # Get all jobs and filter by status
-        all_jobs = job_store.list_jobs()
-        pending_jobs = job_store.list_jobs(status=JobStatus.PENDING)
-        running_jobs = job_store.list_jobs(status=JobStatus.RUNNING)
-        completed_jobs = job_store.list_jobs(status=JobStatus.COMPLETED)
-        failed_jobs = job_store.list_jobs(status=JobStatus.FAILED)
-        
-        # Get groups and workers
-        all_groups = job_store.list_groups()
-        all_workers = job_store.list_workers()
-        active_workers = [w for w in all_workers if w.status != "offline"]
-        
-        stats = {
-            "total_jobs": len(all_jobs),
-            "pending_jobs": len(pending_jobs),
-            "running_jobs": len(running_jobs),
-            "completed_jobs": len(completed_jobs),
-            "failed_jobs": len(failed_jobs),
-            "total_groups": len(all_groups),
-            "total_workers": len(all_workers),
-            "active_workers": len(active_workers)
-        }
-        
-        return jsonify(stats), 200
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
+    with _stats_cache_lock:
+        now = time.monotonic()
+        if _stats_cache["body"] is None or now >= _stats_cache["expires_at"]:
+            # Counters are maintained by the store on every write, so this is O(1)
+            queue_stats = job_store.get_queue_stats()
+            
+            stats = {
+                "total_jobs": queue_stats["total_jobs"],
+                "pending_jobs": queue_stats["pending"],
+                "running_jobs": queue_stats["running"],
+                "completed_jobs": queue_stats["completed"],
+                "failed_jobs": queue_stats["failed"],
+                "total_groups": queue_stats["total_groups"],
+                "total_workers": queue_stats["total_workers"],
+                "active_workers": queue_stats["active_workers"]
+            }
+            
+            _stats_cache["body"] = orjson.dumps(stats)
+            _stats_cache["expires_at"] = now + config.STATS_CACHE_TTL_MS / 1000
+        body = _stats_cache["body"]
+    
+    return Response(body, mimetype='application/json'), 200
 
-if __name__ == '__main__':
-    # Initialize job store with Redis (fallback to in-memory)
-    def create_job_store():
-        """Create job store with Redis if available, fallback to in-memory"""
-        config = get_config()
-        
-        if config.USE_REDIS:
-            try:
-                logger.info("Attempting to connect to Redis...")
-                job_store = RedisJobStore(config.REDIS_URL)
-                logger.info("✅ Using Redis for job storage")
-                return job_store
-            except Exception as e:
-                logger.warning(f"⚠️ Redis connection failed: {e}")
-                logger.info("🔄 Falling back to in-memory storage")
-        
-        # Fallback to in-memory storage
-        logger.info("📝 Using in-memory job storage")
-        return JobStore()
 
-    # Initialize components
-    job_store = create_job_store()
-    scheduler = JobScheduler(job_store)
-    
-    # Start the scheduler in a background thread
-    scheduler.start()
+# Initialize job store with Redis (fallback to in-memory)
+def create_job_store():
+    """Create job store with Redis if available, fallback to in-memory"""
+    if config.USE_REDIS:
+        try:
+            logger.info("Attempting to connect to Redis...")
+            # One pool per process, sized for its request threads
+            pool = create_connection_pool(config.REDIS_URL, config.REDIS_MAX_CONNECTIONS)
+            job_store = RedisJobStore(config.REDIS_URL, connection_pool=pool,
+                                      heartbeat_timeout=config.WORKER_TIMEOUT)
+            logger.info("✅ Using Redis for job storage")
+            return job_store
+        except Exception as e:
+            logger.warning(f"⚠️ Redis connection failed: {e}")
+            logger.info("🔄 Falling back to in-memory storage")
     
-    # Register blueprints
-    app.register_blueprint(jobs_bp)
-    app.register_blueprint(workers_bp)
-    
-    # Run the Flask app
-    app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG) 
\ No newline at end of file
+    # Fallback to in-memory storage
+    logger.info("📝 Using in-memory job storage")
+    return JobStore(heartbeat_timeout=config.WORKER_TIMEOUT)
+
+
+# Initialize components at import time so the app is fully wired whether it
+# is started directly or loaded by gunicorn (`gunicorn -c backend/gunicorn.conf.py backend.app:app`)
+job_store = create_job_store()
+scheduler = JobScheduler(job_store)
+
+# Start the scheduler in a background thread
+scheduler.start()
+
+# Register blueprints
+app.register_blueprint(jobs_bp)
+app.register_blueprint(workers_bp)
+
+
+if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py).
+    # Speak HTTP/1.1 so clients holding a requests.Session keep their connection
+    # alive between heartbeats instead of reconnecting per request.
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"
+    app.run(host=config.HOST, port=config.PORT, debug=config.DEBUG, threaded=True)
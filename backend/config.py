@@ -5,6 +5,7 @@ This module handles configuration for Redis, storage options, and other settings
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 import logging
 
@@ -21,10 +22,31 @@ class Config:
     PORT = int(os.environ.get('PORT', 5000))
     DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
     
+    # WSGI Server Configuration (gunicorn gthread)
+    # The in-memory store and scheduler live inside a process, so scale with
+    # threads rather than processes unless Redis is in use
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', 1))
+    WORKER_THREADS = int(os.environ.get('WORKER_THREADS', 8))
+    KEEPALIVE_TIMEOUT = int(os.environ.get('KEEPALIVE_TIMEOUT', 30))  # seconds
+    
+    # Redis connections per process; each request thread may hold one while
+    # the scheduler and pub/sub listener hold their own
+    REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', WORKER_THREADS * 2))
+    
     # Job Configuration
     MAX_RETRIES = int(os.environ.get('MAX_RETRIES', 3))
     WORKER_TIMEOUT = int(os.environ.get('WORKER_TIMEOUT', 300))  # seconds
     SCHEDULE_INTERVAL = int(os.environ.get('SCHEDULE_INTERVAL', 5))  # seconds
+    HEARTBEAT_MAX_WAIT = int(os.environ.get('HEARTBEAT_MAX_WAIT', 30))  # seconds, long-poll cap
+    JOB_EVENTS_MAX_DURATION = int(os.environ.get('JOB_EVENTS_MAX_DURATION', 300))  # seconds per event stream
+    # Long-polling heartbeats hold a request thread too; past this many,
+    # heartbeats answer at once as if no wait was asked for
+    HEARTBEAT_MAX_WAITERS = int(os.environ.get('HEARTBEAT_MAX_WAITERS', max(WORKER_THREADS // 2, 1)))
+    JOB_EVENTS_KEEPALIVE = int(os.environ.get('JOB_EVENTS_KEEPALIVE', 15))  # seconds between keep-alive comments
+    # Each event stream holds a request thread for its whole life, so only a
+    # share of them may stream; past this, clients are told to poll instead
+    JOB_EVENTS_MAX_STREAMS = int(os.environ.get('JOB_EVENTS_MAX_STREAMS', max(WORKER_THREADS // 4, 1)))
+    STATS_CACHE_TTL_MS = int(os.environ.get('STATS_CACHE_TTL_MS', 1000))  # 0 disables caching
     
     # Security (for production)
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -36,7 +58,8 @@ class Config:
         """Get Redis configuration"""
         return {
             'url': cls.REDIS_URL,
-            'enabled': cls.USE_REDIS
+            'enabled': cls.USE_REDIS,
+            'max_connections': cls.REDIS_MAX_CONNECTIONS
         }
     
     @classmethod
@@ -45,7 +68,10 @@ class Config:
         return {
             'host': cls.HOST,
             'port': cls.PORT,
-            'debug': cls.DEBUG
+            'debug': cls.DEBUG,
+            'web_workers': cls.WEB_WORKERS,
+            'worker_threads': cls.WORKER_THREADS,
+            'keepalive_timeout': cls.KEEPALIVE_TIMEOUT
         }
     
     @classmethod
@@ -54,7 +80,13 @@ class Config:
         return {
             'max_retries': cls.MAX_RETRIES,
             'worker_timeout': cls.WORKER_TIMEOUT,
-            'schedule_interval': cls.SCHEDULE_INTERVAL
+            'schedule_interval': cls.SCHEDULE_INTERVAL,
+            'heartbeat_max_wait': cls.HEARTBEAT_MAX_WAIT,
+            'heartbeat_max_waiters': cls.HEARTBEAT_MAX_WAITERS,
+            'job_events_max_duration': cls.JOB_EVENTS_MAX_DURATION,
+            'job_events_keepalive': cls.JOB_EVENTS_KEEPALIVE,
+            'job_events_max_streams': cls.JOB_EVENTS_MAX_STREAMS,
+            'stats_cache_ttl_ms': cls.STATS_CACHE_TTL_MS
         }
 
     @classmethod
@@ -82,13 +114,21 @@ class ProductionConfig(Config):
 
 
 # Configuration factory
-def get_config(environment: Optional[str] = None) -> Config:
-    """Get configuration based on environment"""
-    env = environment or os.environ.get('ENVIRONMENT', 'development')
-    
+def _build_config(env: str) -> Config:
+    """Instantiate the configuration class for an environment name"""
     if env == 'production':
         return ProductionConfig()
     elif env == 'development':
         return DevelopmentConfig()
     else:
-        return Config() 
\ No newline at end of file
+        return Config()
+
+
+@lru_cache(maxsize=None)
+def get_config(environment: Optional[str] = None) -> Config:
+    """Get configuration based on environment
+    
+    Settings are read from the environment once; every later call returns the
+    same instance.
+    """
+    return _build_config(environment or os.environ.get('ENVIRONMENT', 'development')) 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for the QualGent Job Orchestrator
+
+Runs the Flask app on threaded (gthread) workers with HTTP keep-alive so
+that workers polling /workers/<id>/heartbeat reuse one TCP connection
+instead of paying a new handshake per request.
+
+Usage (from the repository root):
+    gunicorn -c backend/gunicorn.conf.py backend.app:app
+"""
+
+import os
+import sys
+
+# Gunicorn loads this file by path, before its own `chdir` puts the project
+# root on sys.path, so make the `backend` package importable here
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+from backend.config import get_config
+
+_config = get_config()
+
+chdir = _root
+bind = f"{_config.HOST}:{_config.PORT}"
+worker_class = "gthread"
+workers = _config.WEB_WORKERS
+threads = _config.WORKER_THREADS
+keepalive = _config.KEEPALIVE_TIMEOUT
+accesslog = "-"
+loglevel = _config.LOG_LEVEL.lower()
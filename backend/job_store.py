@@ -5,235 +5,418 @@ This module provides an in-memory data store for jobs, job groups, and workers.
 In a production environment, this would be backed by Redis or a database.
 """
 
+import bisect
+import heapq
 import threading
-from typing import Dict, List, Optional
-from datetime import datetime
+from collections import defaultdict
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared import JobStatus, JobTarget, TARGET_BITS, Job, JobGroup, Worker
 
-from shared import JobStatus, JobTarget, Job, JobGroup, Worker
+# Status sets for hot-path membership tests, built once instead of per call
+ACTIVE_GROUP_STATES = frozenset({JobStatus.PENDING, JobStatus.QUEUED, JobStatus.RUNNING})
+TERMINAL_STATES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# Listing order: oldest first, ties broken by job id
+_created_order = attrgetter("created_at", "job_id")
 
 
 class JobStore:
-    """In-memory store for jobs, groups, and workers"""
+    """In-memory store for jobs, groups, and workers
+    
+    Writers serialize per domain on `_jobs_lock`, `_groups_lock` and
+    `_workers_lock`, so job updates, group updates and worker heartbeats do not
+    queue behind each other. An operation spanning workers and jobs takes the
+    workers lock first. Readers take no lock: each read starts by snapshotting
+    what it needs with a single C-level operation (`dict.get`,
+    `list(d.values())`, `set.intersection`, `len`), which the GIL makes atomic,
+    and then works on that private copy. List endpoints therefore never wait
+    behind the scheduler, and vice versa.
+    """
     
-    def __init__(self):
+    def __init__(self, heartbeat_timeout: int = 300):
         self.jobs: Dict[str, Job] = {}
         self.groups: Dict[str, JobGroup] = {}
         self.workers: Dict[str, Worker] = {}
-        self._lock = threading.RLock()
+        self._jobs_lock = threading.RLock()
+        self._groups_lock = threading.RLock()
+        self._workers_lock = threading.RLock()
+        
+        # Secondary indexes (id sets) maintained on every write so filtered
+        # listings touch only matching jobs. The status buckets double as the
+        # per-status counters behind get_queue_stats.
+        self._by_org: Dict[str, Set[str]] = defaultdict(set)
+        self._by_app_version: Dict[str, Set[str]] = defaultdict(set)
+        self._by_target: Dict[JobTarget, Set[str]] = {target: set() for target in JobTarget}
+        self._by_status: Dict[JobStatus, Set[str]] = {status: set() for status in JobStatus}
+        
+        # Jobs and workers are mutated in place before being written back,
+        # so the last indexed status is kept per id to diff against
+        self._job_status: Dict[str, JobStatus] = {}
+        self._worker_status: Dict[str, str] = {}
+        self._worker_status_counts: Dict[str, int] = {"idle": 0, "busy": 0, "offline": 0}
+        
+        # Idle worker ids per target and group ids per (org, app version).
+        # Dicts are used as insertion-ordered sets: workers are re-added each
+        # time they go idle, so the longest-idle worker comes first and work
+        # rotates across them; groups keep creation order.
+        self._idle_workers_by_target: Dict[JobTarget, Dict[str, None]] = {target: {} for target in JobTarget}
+        self._groups_by_app_version: Dict[Tuple[str, str], Dict[str, None]] = defaultdict(dict)
+        
+        # (last_heartbeat, worker_id) kept sorted, so the active workers
+        # (heartbeat within heartbeat_timeout seconds) are a bisectable suffix
+        self.heartbeat_timeout = heartbeat_timeout
+        self._heartbeats: Dict[str, datetime] = {}
+        self._heartbeat_order: List[Tuple[datetime, str]] = []
+        
+        # Min-heap of (completed_at, job_id) pushed when a job finishes, so
+        # cleanup pops only expired entries. Entries are validated on pop
+        # because a job may have been retried or deleted since.
+        self._completed_order: List[Tuple[datetime, str]] = []
+        
+        # (started_at, job_id) of running jobs kept sorted, so jobs running
+        # past a deadline are a bisectable prefix
+        self._running_started: Dict[str, datetime] = {}
+        self._running_order: List[Tuple[datetime, str]] = []
+    
+    def _index_job(self, job: Job) -> None:
+        """Add a job to the indexes, or move it between status buckets"""
+        old_status = self._job_status.get(job.job_id)
+        if old_status is None:
+            self._by_org[job.payload.org_id].add(job.job_id)
+            self._by_app_version[job.payload.app_version_id].add(job.job_id)
+            self._by_target[job.payload.target].add(job.job_id)
+        elif old_status != job.status:
+            self._by_status[old_status].discard(job.job_id)
+        if old_status != job.status and job.status in TERMINAL_STATES and job.completed_at:
+            heapq.heappush(self._completed_order, (job.completed_at, job.job_id))
+        self._by_status[job.status].add(job.job_id)
+        self._job_status[job.job_id] = job.status
+        self._record_running(job.job_id, job.started_at if job.status == JobStatus.RUNNING else None)
+    
+    def _unindex_job(self, job: Job) -> None:
+        """Remove a job from the indexes"""
+        old_status = self._job_status.pop(job.job_id, None)
+        if old_status is not None:
+            self._by_status[old_status].discard(job.job_id)
+        self._by_org[job.payload.org_id].discard(job.job_id)
+        self._by_app_version[job.payload.app_version_id].discard(job.job_id)
+        self._by_target[job.payload.target].discard(job.job_id)
+        self._record_running(job.job_id, None)
+    
+    def _record_running(self, job_id: str, started_at: Optional[datetime]) -> None:
+        """Reposition a job in the running order, or drop it when `started_at` is None"""
+        old_started_at = self._running_started.get(job_id)
+        if old_started_at != started_at:
+            if old_started_at is not None:
+                index = bisect.bisect_left(self._running_order, (old_started_at, job_id))
+                del self._running_order[index]
+                del self._running_started[job_id]
+            if started_at is not None:
+                bisect.insort(self._running_order, (started_at, job_id))
+                self._running_started[job_id] = started_at
+    
+    def _record_worker_status(self, worker: Worker) -> None:
+        """Move a worker between status counters if its status changed"""
+        old_status = self._worker_status.get(worker.worker_id)
+        if old_status != worker.status:
+            if old_status is not None:
+                self._worker_status_counts[old_status] -= 1
+            self._worker_status_counts[worker.status] = self._worker_status_counts.get(worker.status, 0) + 1
+            self._worker_status[worker.worker_id] = worker.status
+            
+            if old_status == "idle":
+                for target in worker.target_types:
+                    self._idle_workers_by_target[target].pop(worker.worker_id, None)
+            elif worker.status == "idle":
+                for target in worker.target_types:
+                    self._idle_workers_by_target[target][worker.worker_id] = None
+    
+    def _record_heartbeat(self, worker: Worker) -> None:
+        """Reposition a worker in the heartbeat order if its heartbeat changed"""
+        old_heartbeat = self._heartbeats.get(worker.worker_id)
+        if old_heartbeat != worker.last_heartbeat:
+            if old_heartbeat is not None:
+                index = bisect.bisect_left(self._heartbeat_order, (old_heartbeat, worker.worker_id))
+                del self._heartbeat_order[index]
+            bisect.insort(self._heartbeat_order, (worker.last_heartbeat, worker.worker_id))
+            self._heartbeats[worker.worker_id] = worker.last_heartbeat
     
     # Job operations
     def add_job(self, job: Job) -> None:
         """Add a new job to the store"""
-        with self._lock:
+        with self._jobs_lock:
             self.jobs[job.job_id] = job
+            self._index_job(job)
+    
+    def add_jobs(self, jobs: List[Job]) -> None:
+        """Add a batch of new jobs to the store under a single lock acquisition"""
+        with self._jobs_lock:
+            for job in jobs:
+                self.jobs[job.job_id] = job
+                self._index_job(job)
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID"""
-        with self._lock:
-            return self.jobs.get(job_id)
+        return self.jobs.get(job_id)
     
-    def update_job(self, job: Job) -> None:
-        """Update an existing job"""
-        with self._lock:
+    def get_jobs(self, job_ids: List[str]) -> List[Job]:
+        """Get several jobs by ID, skipping missing ones"""
+        return [job for job in map(self.jobs.get, job_ids) if job]
+    
+    def update_job(self, job: Job, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing job
+        
+        `fields` is accepted for parity with RedisJobStore; records here are
+        shared objects, so the whole job is always current.
+        """
+        with self._jobs_lock:
             if job.job_id in self.jobs:
                 self.jobs[job.job_id] = job
+                self._index_job(job)
     
     def delete_job(self, job_id: str) -> bool:
         """Delete a job"""
-        with self._lock:
-            if job_id in self.jobs:
-                del self.jobs[job_id]
+        with self._jobs_lock:
+            job = self.jobs.pop(job_id, None)
+            if job:
+                self._unindex_job(job)
                 return True
             return False
     
     def list_jobs(self, org_id: Optional[str] = None, 
                   status: Optional[JobStatus] = None,
-                  app_version_id: Optional[str] = None) -> List[Job]:
-        """List jobs with optional filtering"""
-        with self._lock:
+                  app_version_id: Optional[str] = None,
+                  offset: int = 0, limit: Optional[int] = None,
+                  target: Optional[JobTarget] = None) -> List[Job]:
+        """List jobs with optional filtering, oldest first
+        
+        `offset` and `limit` select one page of the listing.
+        """
+        end = None if limit is None else offset + limit
+        buckets = []
+        if org_id:
+            buckets.append(self._by_org.get(org_id, set()))
+        if status:
+            buckets.append(self._by_status[status])
+        if app_version_id:
+            buckets.append(self._by_app_version.get(app_version_id, set()))
+        if target:
+            buckets.append(self._by_target[target])
+        
+        if not buckets:
+            # Already in submission order unless a job carried its own
+            # created_at, so this sort is close to a single pass. The id breaks
+            # ties between jobs created in the same instant, e.g. one bulk batch
             jobs = list(self.jobs.values())
-            
-            if org_id:
-                jobs = [j for j in jobs if j.payload.org_id == org_id]
-            
-            if status:
-                jobs = [j for j in jobs if j.status == status]
-            
-            if app_version_id:
-                jobs = [j for j in jobs if j.payload.app_version_id == app_version_id]
-            
-            return jobs
+            jobs.sort(key=_created_order)
+            return jobs[offset:end]
+        
+        # The intersection is a private copy; ids deleted since then are skipped
+        job_ids = set.intersection(*buckets) if len(buckets) > 1 else set(buckets[0])
+        # One pass resolves and rechecks; a job moved to another status after
+        # the snapshot no longer matches
+        jobs = [job for job in map(self.jobs.get, job_ids)
+                if job and (not status or job.status == status)]
+        # Same order as the unfiltered listing
+        jobs.sort(key=_created_order)
+        return jobs[offset:end]
     
     def get_jobs_by_status(self, status: JobStatus) -> List[Job]:
         """Get all jobs with a specific status"""
-        with self._lock:
-            return [job for job in self.jobs.values() if job.status == status]
+        jobs = map(self.jobs.get, set(self._by_status[status]))
+        return [job for job in jobs if job and job.status == status]
     
     def get_jobs_by_group(self, group_id: str) -> List[Job]:
         """Get all jobs in a specific group"""
-        with self._lock:
-            group = self.groups.get(group_id)
-            if not group:
-                return []
-            
-            return [self.jobs[job_id] for job_id in group.jobs if job_id in self.jobs]
+        group = self.groups.get(group_id)
+        if not group:
+            return []
+        
+        return self.get_jobs(list(group.jobs))
+    
+    def get_running_jobs_started_before(self, cutoff: datetime) -> List[Job]:
+        """Get running jobs whose started_at is earlier than `cutoff`"""
+        with self._jobs_lock:
+            end = bisect.bisect_left(self._running_order, (cutoff, ""))
+            job_ids = [job_id for _, job_id in self._running_order[:end]]
+        return self.get_jobs(job_ids)
     
     # Group operations
     def add_group(self, group: JobGroup) -> None:
         """Add a new job group"""
-        with self._lock:
+        with self._groups_lock:
             self.groups[group.group_id] = group
+            self._groups_by_app_version[(group.org_id, group.app_version_id)][group.group_id] = None
     
     def get_group(self, group_id: str) -> Optional[JobGroup]:
         """Get a group by ID"""
-        with self._lock:
-            return self.groups.get(group_id)
+        return self.groups.get(group_id)
     
-    def update_group(self, group: JobGroup) -> None:
-        """Update an existing group"""
-        with self._lock:
+    def update_group(self, group: JobGroup, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing group (`fields` as in update_job)"""
+        with self._groups_lock:
             if group.group_id in self.groups:
                 self.groups[group.group_id] = group
     
     def get_group_by_app_version(self, org_id: str, app_version_id: str) -> Optional[JobGroup]:
         """Get group for a specific org and app version"""
-        with self._lock:
-            for group in self.groups.values():
-                if (group.org_id == org_id and 
-                    group.app_version_id == app_version_id and
-                    group.status in [JobStatus.PENDING, JobStatus.QUEUED, JobStatus.RUNNING]):
-                    return group
-            return None
-    
-    def list_groups(self, org_id: Optional[str] = None) -> List[JobGroup]:
+        # Snapshot the ids, then resolve and filter without the lock
+        group_ids = list(self._groups_by_app_version.get((org_id, app_version_id), ()))
+        groups = self.groups
+        for group_id in group_ids:
+            group = groups.get(group_id)
+            if group is not None and group.status in ACTIVE_GROUP_STATES:
+                return group
+        return None
+    
+    def list_groups(self, org_id: Optional[str] = None,
+                    status: Optional[JobStatus] = None) -> List[JobGroup]:
         """List job groups with optional filtering"""
-        with self._lock:
-            groups = list(self.groups.values())
-            
-            if org_id:
-                groups = [g for g in groups if g.org_id == org_id]
-            
-            return groups
+        groups = list(self.groups.values())
+        
+        if org_id or status:
+            groups = [g for g in groups
+                      if (not org_id or g.org_id == org_id) and (not status or g.status == status)]
+        
+        return groups
     
     def add_job_to_group(self, job_id: str, group_id: str) -> bool:
         """Add a job to an existing group"""
-        with self._lock:
+        with self._groups_lock:
             group = self.groups.get(group_id)
             if group and job_id not in group.jobs:
-                group.jobs.append(job_id)
+                group.jobs[job_id] = None
                 return True
             return False
     
     # Worker operations
     def add_worker(self, worker: Worker) -> None:
         """Add a new worker"""
-        with self._lock:
+        with self._workers_lock:
             self.workers[worker.worker_id] = worker
+            self._record_worker_status(worker)
+            self._record_heartbeat(worker)
     
     def get_worker(self, worker_id: str) -> Optional[Worker]:
         """Get a worker by ID"""
-        with self._lock:
-            return self.workers.get(worker_id)
+        return self.workers.get(worker_id)
     
-    def update_worker(self, worker: Worker) -> None:
-        """Update an existing worker"""
-        with self._lock:
+    def update_worker(self, worker: Worker, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing worker (`fields` as in update_job)"""
+        with self._workers_lock:
             if worker.worker_id in self.workers:
                 self.workers[worker.worker_id] = worker
+                self._record_worker_status(worker)
+                self._record_heartbeat(worker)
     
     def list_workers(self, target_type: Optional[JobTarget] = None,
                      status: Optional[str] = None) -> List[Worker]:
         """List workers with optional filtering"""
-        with self._lock:
-            workers = list(self.workers.values())
-            
-            if target_type:
-                workers = [w for w in workers if target_type in w.target_types]
-            
-            if status:
-                workers = [w for w in workers if w.status == status]
-            
+        workers = list(self.workers.values())
+        if not target_type and not status:
             return workers
+        
+        # Apply both filters in a single pass
+        bit = TARGET_BITS[target_type] if target_type else 0
+        return [w for w in workers
+                if (not bit or w.target_mask & bit) and (not status or w.status == status)]
     
     def get_available_workers(self, target_type: JobTarget) -> List[Worker]:
         """Get workers that can handle a specific target type and are available"""
-        with self._lock:
-            available = []
-            for worker in self.workers.values():
-                if (target_type in worker.target_types and 
-                    worker.status == "idle" and
-                    len(worker.current_jobs) == 0):
-                    available.append(worker)
-            return available
+        workers = map(self.workers.get, list(self._idle_workers_by_target[target_type]))
+        return [worker for worker in workers
+                if worker and worker.status == "idle" and len(worker.current_jobs) == 0]
     
     def assign_job_to_worker(self, job_id: str, worker_id: str) -> bool:
-        """Assign a job to a worker"""
-        with self._lock:
+        """Assign a pending, unassigned job to a worker"""
+        with self._workers_lock, self._jobs_lock:
             worker = self.workers.get(worker_id)
             job = self.jobs.get(job_id)
             
-            if worker and job:
+            if worker and job and job.status == JobStatus.PENDING and not job.worker_id:
                 if job_id not in worker.current_jobs:
-                    worker.current_jobs.append(job_id)
+                    worker.current_jobs[job_id] = None
                     worker.status = "busy"
+                    self._record_worker_status(worker)
                 job.worker_id = worker_id
                 job.status = JobStatus.QUEUED
                 job.updated_at = datetime.utcnow()
+                self._index_job(job)
                 return True
             return False
     
+    def assign_jobs_to_worker(self, job_ids: List[str], worker_id: str) -> List[str]:
+        """Assign several jobs to one worker, returning the IDs assigned"""
+        with self._workers_lock, self._jobs_lock:
+            return [job_id for job_id in job_ids
+                    if self.assign_job_to_worker(job_id, worker_id)]
+    
     def complete_job_for_worker(self, job_id: str, worker_id: str) -> bool:
         """Remove a completed job from worker's current jobs"""
-        with self._lock:
+        with self._workers_lock:
             worker = self.workers.get(worker_id)
             
             if worker and job_id in worker.current_jobs:
-                worker.current_jobs.remove(job_id)
+                del worker.current_jobs[job_id]
                 if len(worker.current_jobs) == 0:
                     worker.status = "idle"
+                    self._record_worker_status(worker)
                 return True
             return False
     
     # Utility methods
     def get_queue_stats(self) -> Dict[str, int]:
         """Get queue statistics"""
-        with self._lock:
-            stats = {
-                "total_jobs": len(self.jobs),
-                "pending": 0,
-                "queued": 0,
-                "running": 0,
-                "completed": 0,
-                "failed": 0,
-                "cancelled": 0
-            }
-            
-            for job in self.jobs.values():
-                stats[job.status.value] += 1
-            
-            stats["total_groups"] = len(self.groups)
-            stats["total_workers"] = len(self.workers)
-            stats["idle_workers"] = len([w for w in self.workers.values() if w.status == "idle"])
-            stats["busy_workers"] = len([w for w in self.workers.values() if w.status == "busy"])
-            
-            return stats
+        # Each counter is read atomically; together they may straddle a write,
+        # which is fine for monitoring
+        stats = {"total_jobs": len(self.jobs)}
+        for status, job_ids in self._by_status.items():
+            stats[status.value] = len(job_ids)
+        
+        stats["total_groups"] = len(self.groups)
+        stats["total_workers"] = len(self.workers)
+        stats["idle_workers"] = self._worker_status_counts.get("idle", 0)
+        stats["busy_workers"] = self._worker_status_counts.get("busy", 0)
+        stats["active_workers"] = self.count_active_workers()
+        
+        return stats
+    
+    def get_workers_with_heartbeat_before(self, cutoff: datetime) -> List[Worker]:
+        """Get workers whose last heartbeat is earlier than `cutoff`"""
+        with self._workers_lock:
+            end = bisect.bisect_left(self._heartbeat_order, (cutoff, ""))
+            worker_ids = [worker_id for _, worker_id in self._heartbeat_order[:end]]
+        workers = map(self.workers.get, worker_ids)
+        return [worker for worker in workers if worker]
+    
+    def count_active_workers(self) -> int:
+        """Count workers that sent a heartbeat within heartbeat_timeout"""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.heartbeat_timeout)
+        with self._workers_lock:
+            # An empty id sorts before any real one with the same timestamp
+            return len(self._heartbeat_order) - bisect.bisect_left(self._heartbeat_order, (cutoff, ""))
     
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Clean up old completed/failed jobs"""
-        with self._lock:
-            cutoff_time = datetime.utcnow().timestamp() - (max_age_hours * 3600)
-            jobs_to_remove = []
-            
-            for job_id, job in self.jobs.items():
-                if (job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED] and
-                    job.completed_at and job.completed_at.timestamp() < cutoff_time):
-                    jobs_to_remove.append(job_id)
+        with self._jobs_lock:
+            cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+            removed = 0
             
-            for job_id in jobs_to_remove:
-                del self.jobs[job_id]
+            # Pop only the expired prefix of the completion heap
+            completed_order = self._completed_order
+            while completed_order and completed_order[0][0] < cutoff_time:
+                completed_at, job_id = heapq.heappop(completed_order)
+                job = self.jobs.get(job_id)
+                if job is None or job.status not in TERMINAL_STATES or not job.completed_at:
+                    continue
+                if job.completed_at != completed_at:
+                    # Finished again since it was pushed; requeue at its new time
+                    heapq.heappush(completed_order, (job.completed_at, job_id))
+                    continue
+                self._unindex_job(self.jobs.pop(job_id))
+                removed += 1
             
-            return len(jobs_to_remove) 
\ No newline at end of file
+            return removed 
\ No newline at end of file
@@ -5,29 +5,239 @@ This module provides a Redis-backed data store for jobs, job groups, and workers
 It provides the same interface as the in-memory job store but with persistence.
 """
 
-import json
+import socket
 import threading
-from typing import Dict, List, Optional
-from datetime import datetime
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+import orjson
 import redis
 import logging
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from shared import JobStatus, JobTarget, Job, JobGroup, Worker
+from shared import JobStatus, JobTarget, TARGET_BITS, Job, JobGroup, JobPayload, Worker
+from .job_store import TERMINAL_STATES
 
 logger = logging.getLogger(__name__)
 
+# Enum members by stored value; a dict hit is much cheaper than Enum.__call__
+# on the per-record deserialize path
+_STATUS_BY_VALUE = {s.value: s for s in JobStatus}
+_TARGET_BY_VALUE = {t.value: t for t in JobTarget}
+
+
+def _encode_str(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _encode_enum(value) -> str:
+    # _value_ skips the Enum `.value` descriptor
+    return value._value_
+
+
+def _encode_datetime(value) -> str:
+    return "" if value is None else value.isoformat()
+
+
+def _encode_json(value):
+    # orjson writes enum members (e.g. target_types) by value
+    return "" if value is None else orjson.dumps(value)
+
+
+def _encode_ids(value):
+    # Id sets (dicts keyed by id) are stored as JSON arrays
+    return orjson.dumps(list(value))
+
+
+def _encode_payload(value) -> bytes:
+    return orjson.dumps(value.to_dict())
+
+
+# One encoder per hash field, fixed by the schema, so encoding a record is a
+# straight lookup per field with no type dispatch. Values match to_dict, with
+# None stored as "". The key order is the stored field order.
+_JOB_ENCODERS = {
+    "job_id": _encode_str, "payload": _encode_payload, "status": _encode_enum,
+    "created_at": _encode_datetime, "updated_at": _encode_datetime,
+    "started_at": _encode_datetime, "completed_at": _encode_datetime,
+    "worker_id": _encode_str, "result": _encode_json, "error_message": _encode_str,
+    "retry_count": _encode_str, "max_retries": _encode_str,
+}
+_GROUP_ENCODERS = {
+    "group_id": _encode_str, "org_id": _encode_str, "app_version_id": _encode_str,
+    "jobs": _encode_ids, "status": _encode_enum, "created_at": _encode_datetime,
+    "assigned_worker": _encode_str,
+}
+_WORKER_ENCODERS = {
+    "worker_id": _encode_str, "name": _encode_str, "target_types": _encode_json,
+    "status": _encode_str, "current_jobs": _encode_ids,
+    "last_heartbeat": _encode_datetime, "metadata": _encode_json,
+}
+
+
+def _encode_fields(record, encoders: dict, fields: Iterable[str]) -> dict:
+    """Flatten the named attributes of a record into hash fields
+    
+    Attributes are read straight off the (slotted) record, so a partial
+    update encodes only what it writes and never builds the full to_dict.
+    """
+    return {name: encoders[name](getattr(record, name)) for name in fields}
+
+
+def create_connection_pool(redis_url: str, max_connections: int) -> redis.ConnectionPool:
+    """Create a bounded connection pool shared by every thread in the process
+    
+    Threads wait for a free connection instead of failing when the pool is
+    exhausted, and TCP keepalive stops idle connections between heartbeats
+    from being dropped by the OS or middleboxes.
+    """
+    keepalive_options = {}
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        # Not every platform exposes all of these
+        if hasattr(socket, name):
+            keepalive_options[getattr(socket, name)] = value
+    
+    return redis.BlockingConnectionPool.from_url(
+        redis_url,
+        max_connections=max_connections,
+        timeout=5,
+        health_check_interval=30,
+        socket_keepalive=True,
+        socket_keepalive_options=keepalive_options,
+        decode_responses=True
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_payload(raw: str) -> JobPayload:
+    """Parse a stored payload, reusing the result for payloads seen recently
+    
+    A job's payload is written once and never changes, so keying on the raw
+    string skips the parse on every repeat listing. Payloads are treated as
+    read-only, which is what makes sharing the instance safe.
+    """
+    return JobPayload.from_dict(orjson.loads(raw))
+
+
+# Assignment and completion run server-side so the worker and job records,
+# the job status index and the worker status counters change together in one
+# round trip, atomically with respect to every process sharing the database.
+# Every key a script touches is passed in KEYS; the idle worker indexes are
+# passed for every target, in JobTarget order.
+#
+# Only a pending job with no worker is assigned. Schedulers in several
+# processes wake on the same new-job message, and this keeps two of them from
+# handing one job to two workers; the loser gets 0 and changes nothing.
+#
+# KEYS: worker hash, job hash, worker status counts hash, pending job status
+#       index, queued job status index, idle worker index per target...
+# ARGV: job id, worker id, now (ISO), pending status value, queued status value
+_ASSIGN_JOB_SCRIPT = """
+local job = redis.call('HMGET', KEYS[2], 'status', 'worker_id')
+local current = redis.call('HGET', KEYS[1], 'current_jobs')
+if job[1] ~= ARGV[4] or (job[2] and job[2] ~= '') or not current then
+    return 0
+end
+
+local jobs = cjson.decode(current)
+local found = false
+for _, id in ipairs(jobs) do
+    if id == ARGV[1] then
+        found = true
+    end
+end
+if not found then
+    table.insert(jobs, ARGV[1])
+    local old_worker_status = redis.call('HGET', KEYS[1], 'status')
+    redis.call('HSET', KEYS[1], 'current_jobs', cjson.encode(jobs), 'status', 'busy')
+    if old_worker_status ~= 'busy' then
+        redis.call('HINCRBY', KEYS[3], old_worker_status, -1)
+        redis.call('HINCRBY', KEYS[3], 'busy', 1)
+    end
+    if old_worker_status == 'idle' then
+        for i = 6, #KEYS do
+            redis.call('ZREM', KEYS[i], ARGV[2])
+        end
+    end
+end
+
+redis.call('HSET', KEYS[2], 'worker_id', ARGV[2], 'status', ARGV[5], 'updated_at', ARGV[3])
+redis.call('SMOVE', KEYS[4], KEYS[5], ARGV[1])
+return 1
+"""
+
+# KEYS: worker hash, worker status counts hash, idle worker index per target...
+# ARGV: job id, worker id, now (epoch seconds), target value per idle index...
+_COMPLETE_JOB_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'current_jobs')
+if not current then
+    return 0
+end
+
+local remaining = {}
+local found = false
+for _, id in ipairs(cjson.decode(current)) do
+    if id == ARGV[1] then
+        found = true
+    else
+        table.insert(remaining, id)
+    end
+end
+if not found then
+    return 0
+end
+
+if #remaining == 0 then
+    -- cjson would encode the empty table as an object
+    local old_status = redis.call('HGET', KEYS[1], 'status')
+    redis.call('HSET', KEYS[1], 'current_jobs', '[]', 'status', 'idle')
+    if old_status ~= 'idle' then
+        redis.call('HINCRBY', KEYS[2], old_status, -1)
+        redis.call('HINCRBY', KEYS[2], 'idle', 1)
+        local targets = {}
+        for _, target in ipairs(cjson.decode(redis.call('HGET', KEYS[1], 'target_types'))) do
+            targets[target] = true
+        end
+        for i = 3, #KEYS do
+            if targets[ARGV[i + 1]] then
+                redis.call('ZADD', KEYS[i], ARGV[3], ARGV[2])
+            end
+        end
+    end
+else
+    redis.call('HSET', KEYS[1], 'current_jobs', cjson.encode(remaining))
+end
+return 1
+"""
+
+# A heartbeat moves no status or counter, so it is written without first
+# reading the worker; the existence check keeps a late heartbeat from
+# recreating a deleted worker as a partial hash.
+#
+# KEYS: worker hash, heartbeat index
+# ARGV: worker id, last heartbeat (ISO), last heartbeat (epoch seconds)
+_TOUCH_WORKER_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'last_heartbeat', ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+return 1
+"""
+
 
 class RedisJobStore:
     """Redis-backed store for jobs, groups, and workers"""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379/0"):
-        """Initialize Redis connection"""
+    def __init__(self, redis_url: str = "redis://localhost:6379/0",
+                 connection_pool: Optional[redis.ConnectionPool] = None,
+                 heartbeat_timeout: int = 300):
+        """Initialize Redis connection, reusing `connection_pool` when given"""
         try:
-            self.redis = redis.from_url(redis_url, decode_responses=True)
+            if connection_pool is not None:
+                self.redis = redis.Redis(connection_pool=connection_pool)
+            else:
+                self.redis = redis.from_url(redis_url, decode_responses=True)
             # Test connection
             self.redis.ping()
             logger.info(f"Connected to Redis at {redis_url}")
@@ -35,7 +245,15 @@ class RedisJobStore:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
         
+        # Serializes this process's read-modify-write sequences (e.g. reading a
+        # record's old status before moving it between index sets). Reads go
+        # straight to the thread-safe connection pool without it.
         self._lock = threading.RLock()
+        # Script objects run via EVALSHA and reload themselves after SCRIPT FLUSH
+        self._assign_job = self.redis.register_script(_ASSIGN_JOB_SCRIPT)
+        self._complete_job = self.redis.register_script(_COMPLETE_JOB_SCRIPT)
+        self._touch_worker = self.redis.register_script(_TOUCH_WORKER_SCRIPT)
+        self.heartbeat_timeout = heartbeat_timeout
         
         # Redis key prefixes
         self.JOB_PREFIX = "job:"
@@ -44,71 +262,171 @@ class RedisJobStore:
         self.JOB_LIST = "jobs"
         self.GROUP_LIST = "groups"
         self.WORKER_LIST = "workers"
+        self.NEW_JOB_CHANNEL = "qg:new_job"
+        
+        # Secondary index sets, maintained in the same pipeline as each write.
+        # The status sets double as the per-status job counters.
+        self.JOB_ORG_INDEX = "idx:job:org:"
+        self.JOB_STATUS_INDEX = "idx:job:status:"
+        self.JOB_APP_VERSION_INDEX = "idx:job:appver:"
+        self.JOB_TARGET_INDEX = "idx:job:target:"
+        # Hash of worker counts by status, moved with HINCRBY on each transition
+        self.WORKER_STATUS_COUNTS = "qg:stats:worker_status"
+        # Sorted set of worker ids scored by last heartbeat (epoch seconds)
+        self.WORKER_HEARTBEAT_INDEX = "idx:worker:heartbeat"
+        # Sorted sets of idle worker ids per target, scored by when each went
+        # idle, so the longest-idle worker is handed out first
+        self.WORKER_IDLE_INDEX = "idx:worker:idle:"
+        # Idle indexes for every target, in the order the scripts expect them
+        self._idle_index_keys = [f"{self.WORKER_IDLE_INDEX}{target.value}" for target in JobTarget]
+        self._target_values = [target.value for target in JobTarget]
+        # Sorted set of finished job ids scored by completed_at (epoch seconds)
+        self.JOB_COMPLETED_INDEX = "idx:job:completed"
+        # Sorted set of running job ids scored by started_at (epoch seconds)
+        self.JOB_RUNNING_INDEX = "idx:job:running"
+        # Groups by (org, app version, status), for get_group_by_app_version
+        self.GROUP_APP_VERSION_INDEX = "idx:group:org:{org_id}:appver:{app_version_id}:status:{status}"
+        # Groups by status alone, for the scheduler's pending-group resync
+        self.GROUP_STATUS_INDEX = "idx:group:status:"
+        self.INDEXES_INITIALIZED = "qg:indexes:initialized"
+        # Scratch key for multi-index job filters; only touched inside MULTI/EXEC
+        self.JOB_FILTER_SCRATCH = "qg:tmp:job_filter"
+        # Job hash field listings sort on: created_at at fixed width, then the
+        # job id, so jobs created in the same instant still page in one order
+        self.JOB_ORDER_FIELD = "order_key"
+        
+        # Hash fields of each record type, for SORT ... GET listings
+        self.JOB_FIELDS = tuple(_JOB_ENCODERS)
+        self.GROUP_FIELDS = tuple(_GROUP_ENCODERS)
+        self.WORKER_FIELDS = tuple(_WORKER_ENCODERS)
+        # Bump when an index is added so existing data gets backfilled
+        self.INDEX_VERSION = "9"
+        
+        self._ensure_indexes()
     
-    def _serialize_job(self, job: Job) -> dict:
-        """Serialize job object to Redis-compatible dict"""
-        data = job.to_dict()
-        # Convert datetime objects to ISO format strings
-        for key in ['created_at', 'updated_at', 'started_at', 'completed_at']:
-            if data.get(key):
-                if isinstance(data[key], datetime):
-                    data[key] = data[key].isoformat()
+    def _ensure_indexes(self) -> None:
+        """Backfill indexes and counters for data written before they existed"""
+        if self.redis.get(self.INDEXES_INITIALIZED) == self.INDEX_VERSION:
+            return
         
-        # Convert complex objects to JSON strings
-        serialized_data = {}
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                serialized_data[key] = json.dumps(value)
-            else:
-                serialized_data[key] = str(value) if value is not None else ""
+        # Every write below is idempotent, so rebuilding over a partial index is safe
         
-        return serialized_data
+        pipe = self.redis.pipeline()
+        # Counters are rebuilt from scratch; the per-status string keys used
+        # before the counts hash are dropped
+        pipe.delete(*[f"{self.WORKER_STATUS_COUNTS}:{status}" for status in ("idle", "busy", "offline")])
+        pipe.delete(self.WORKER_STATUS_COUNTS)
+        pipe.hset(self.WORKER_STATUS_COUNTS, mapping={"idle": 0, "busy": 0, "offline": 0})
+        for job in self.list_jobs():
+            self._index_job(pipe, job)
+        for group in self.list_groups():
+            pipe.sadd(self._group_index_key(group.org_id, group.app_version_id, group.status),
+                      group.group_id)
+            pipe.sadd(f"{self.GROUP_STATUS_INDEX}{group.status.value}", group.group_id)
+        for worker in self.list_workers():
+            pipe.hincrby(self.WORKER_STATUS_COUNTS, worker.status, 1)
+            self._index_heartbeat(pipe, worker)
+            self._index_idle(pipe, worker, None)
+        pipe.set(self.INDEXES_INITIALIZED, self.INDEX_VERSION)
+        pipe.execute()
+    
+    def _index_job(self, pipe, job: Job) -> None:
+        """Queue index writes for a new job on a pipeline"""
+        pipe.sadd(f"{self.JOB_ORG_INDEX}{job.payload.org_id}", job.job_id)
+        pipe.sadd(f"{self.JOB_APP_VERSION_INDEX}{job.payload.app_version_id}", job.job_id)
+        pipe.sadd(f"{self.JOB_TARGET_INDEX}{job.payload.target.value}", job.job_id)
+        pipe.sadd(f"{self.JOB_STATUS_INDEX}{job.status.value}", job.job_id)
+        pipe.hset(f"{self.JOB_PREFIX}{job.job_id}", self.JOB_ORDER_FIELD,
+                  f"{job.created_at.isoformat(timespec='microseconds')}|{job.job_id}")
+        self._index_job_times(pipe, job)
+    
+    def _index_job_times(self, pipe, job: Job) -> None:
+        """Queue the running- and completion-index writes for a job on a pipeline"""
+        # started_at and completed_at are naive UTC
+        if job.status == JobStatus.RUNNING and job.started_at:
+            timestamp = job.started_at.replace(tzinfo=timezone.utc).timestamp()
+            pipe.zadd(self.JOB_RUNNING_INDEX, {job.job_id: timestamp})
+        else:
+            pipe.zrem(self.JOB_RUNNING_INDEX, job.job_id)
+        if job.status in TERMINAL_STATES and job.completed_at:
+            timestamp = job.completed_at.replace(tzinfo=timezone.utc).timestamp()
+            pipe.zadd(self.JOB_COMPLETED_INDEX, {job.job_id: timestamp})
+    
+    def _unindex_job(self, pipe, job_id: str, status: str, payload: str) -> None:
+        """Queue removal of a stored job and its index entries on a pipeline"""
+        payload = orjson.loads(payload)
+        pipe.delete(f"{self.JOB_PREFIX}{job_id}")
+        pipe.srem(self.JOB_LIST, job_id)
+        pipe.srem(f"{self.JOB_STATUS_INDEX}{status}", job_id)
+        pipe.srem(f"{self.JOB_ORG_INDEX}{payload['org_id']}", job_id)
+        pipe.srem(f"{self.JOB_APP_VERSION_INDEX}{payload['app_version_id']}", job_id)
+        pipe.srem(f"{self.JOB_TARGET_INDEX}{payload['target']}", job_id)
+        pipe.zrem(self.JOB_COMPLETED_INDEX, job_id)
+        pipe.zrem(self.JOB_RUNNING_INDEX, job_id)
+    
+    def _group_index_key(self, org_id: str, app_version_id: str, status: JobStatus) -> str:
+        """Key of the group index set for an org, app version and status"""
+        return self.GROUP_APP_VERSION_INDEX.format(
+            org_id=org_id, app_version_id=app_version_id, status=status.value)
+    
+    def _index_heartbeat(self, pipe, worker: Worker) -> None:
+        """Queue the heartbeat-index write for a worker on a pipeline"""
+        # last_heartbeat is naive UTC
+        timestamp = worker.last_heartbeat.replace(tzinfo=timezone.utc).timestamp()
+        pipe.zadd(self.WORKER_HEARTBEAT_INDEX, {worker.worker_id: timestamp})
+    
+    def _index_idle(self, pipe, worker: Worker, old_status: Optional[str]) -> None:
+        """Queue idle-index writes for a worker whose status may have changed"""
+        if old_status == worker.status:
+            return
+        for target in worker.target_types:
+            key = f"{self.WORKER_IDLE_INDEX}{target.value}"
+            if worker.status == "idle":
+                pipe.zadd(key, {worker.worker_id: time.time()})
+            elif old_status == "idle":
+                pipe.zrem(key, worker.worker_id)
+    
+    def _serialize_job(self, job: Job, fields: Optional[Iterable[str]] = None) -> dict:
+        """Serialize job object to Redis-compatible dict, optionally only some fields"""
+        return _encode_fields(job, _JOB_ENCODERS, self.JOB_FIELDS if fields is None else fields)
     
     def _deserialize_job(self, data: dict) -> Job:
         """Deserialize Redis dict to Job object"""
-        from shared import JobPayload
-        
-        # Convert ISO format strings back to datetime objects
+        # Convert ISO format strings back to datetime objects, and "" back to None,
+        # keeping the stored strings to seed the job's isoformat cache
+        iso = {}
         for key in ['created_at', 'updated_at', 'started_at', 'completed_at']:
-            if data.get(key):
-                data[key] = datetime.fromisoformat(data[key])
+            text = data.get(key)
+            if text:
+                data[key] = datetime.fromisoformat(text)
+                iso[key] = (data[key], text)
+            else:
+                data[key] = None
         
         # Reconstruct JobPayload
-        payload_data = data['payload']
-        payload = JobPayload.from_dict(payload_data)
+        payload = _parse_payload(data['payload'])
         
         # Create Job object
         job = Job(
             job_id=data['job_id'],
             payload=payload,
-            status=JobStatus(data['status']),
+            status=_STATUS_BY_VALUE[data['status']],
             created_at=data['created_at'],
             updated_at=data['updated_at'],
             started_at=data.get('started_at'),
             completed_at=data.get('completed_at'),
-            worker_id=data.get('worker_id'),
+            worker_id=data.get('worker_id') or None,
             result=data.get('result'),
-            error_message=data.get('error_message'),
-            retry_count=data.get('retry_count', 0),
-            max_retries=data.get('max_retries', 3)
+            error_message=data.get('error_message') or None,
+            retry_count=int(data.get('retry_count', 0)),
+            max_retries=int(data.get('max_retries', 3))
         )
+        job._iso_cache.update(iso)
         return job
     
-    def _serialize_group(self, group: JobGroup) -> dict:
-        """Serialize group object to Redis-compatible dict"""
-        data = group.to_dict()
-        if isinstance(data['created_at'], datetime):
-            data['created_at'] = data['created_at'].isoformat()
-        
-        # Convert complex objects to JSON strings
-        serialized_data = {}
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                serialized_data[key] = json.dumps(value)
-            else:
-                serialized_data[key] = str(value) if value is not None else ""
-        
-        return serialized_data
+    def _serialize_group(self, group: JobGroup, fields: Optional[Iterable[str]] = None) -> dict:
+        """Serialize group object to Redis-compatible dict, optionally only some fields"""
+        return _encode_fields(group, _GROUP_ENCODERS, self.GROUP_FIELDS if fields is None else fields)
     
     def _deserialize_group(self, data: dict) -> JobGroup:
         """Deserialize Redis dict to JobGroup object"""
@@ -120,27 +438,15 @@ class RedisJobStore:
             org_id=data['org_id'],
             app_version_id=data['app_version_id'],
             jobs=data['jobs'],
-            status=JobStatus(data['status']),
+            status=_STATUS_BY_VALUE[data['status']],
             created_at=data['created_at'],
-            assigned_worker=data.get('assigned_worker')
+            assigned_worker=data.get('assigned_worker') or None
         )
         return group
     
-    def _serialize_worker(self, worker: Worker) -> dict:
-        """Serialize worker object to Redis-compatible dict"""
-        data = worker.to_dict()
-        if isinstance(data['last_heartbeat'], datetime):
-            data['last_heartbeat'] = data['last_heartbeat'].isoformat()
-        
-        # Convert complex objects to JSON strings
-        serialized_data = {}
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                serialized_data[key] = json.dumps(value)
-            else:
-                serialized_data[key] = str(value) if value is not None else ""
-        
-        return serialized_data
+    def _serialize_worker(self, worker: Worker, fields: Optional[Iterable[str]] = None) -> dict:
+        """Serialize worker object to Redis-compatible dict, optionally only some fields"""
+        return _encode_fields(worker, _WORKER_ENCODERS, self.WORKER_FIELDS if fields is None else fields)
     
     def _deserialize_worker(self, data: dict) -> Worker:
         """Deserialize Redis dict to Worker object"""
@@ -150,7 +456,7 @@ class RedisJobStore:
         worker = Worker(
             worker_id=data['worker_id'],
             name=data['name'],
-            target_types=[JobTarget(t) for t in data['target_types']],
+            target_types=[_TARGET_BY_VALUE[t] for t in data['target_types']],
             status=data['status'],
             current_jobs=data['current_jobs'],
             last_heartbeat=data['last_heartbeat'],
@@ -166,58 +472,165 @@ class RedisJobStore:
             job_data = self._serialize_job(job)
             pipe.hset(f"{self.JOB_PREFIX}{job.job_id}", mapping=job_data)
             pipe.sadd(self.JOB_LIST, job.job_id)
+            self._index_job(pipe, job)
+            pipe.publish(self.NEW_JOB_CHANNEL, job.job_id)
+            pipe.execute()
+    
+    def add_jobs(self, jobs: List[Job]) -> None:
+        """Add a batch of new jobs in a single MULTI/EXEC round trip"""
+        with self._lock:
+            pipe = self.redis.pipeline()
+            for job in jobs:
+                pipe.hset(f"{self.JOB_PREFIX}{job.job_id}", mapping=self._serialize_job(job))
+                self._index_job(pipe, job)
+            pipe.sadd(self.JOB_LIST, *[job.job_id for job in jobs])
+            pipe.publish(self.NEW_JOB_CHANNEL, len(jobs))
             pipe.execute()
     
+    def subscribe_new_jobs(self, callback: Callable[[], None]):
+        """Call `callback` from a background thread whenever a job is added
+        
+        Returns the pub/sub worker thread; call its stop() to unsubscribe.
+        """
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.NEW_JOB_CHANNEL: lambda message: callback()})
+        return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+    
+    def _load_job(self, data: dict) -> Optional[Job]:
+        """Build a job from its raw hash, or None if the hash was empty"""
+        if data:
+            # Parse nested JSON fields; the payload is parsed (and cached) on deserialize
+            if 'result' in data:
+                data['result'] = orjson.loads(data['result']) if data['result'] else None
+            return self._deserialize_job(data)
+        return None
+    
+    def _fetch_many(self, prefix: str, ids) -> List[dict]:
+        """HGETALL many records in one pipelined round-trip"""
+        pipe = self.redis.pipeline(transaction=False)
+        for record_id in ids:
+            pipe.hgetall(f"{prefix}{record_id}")
+        return pipe.execute()
+    
+    def _sort_args(self, prefix: str, fields, offset: int = 0,
+                   limit: Optional[int] = None, order_by: Optional[str] = None) -> dict:
+        """Keyword arguments for a SORT that returns every field of each record
+        
+        `offset` and `limit` become a LIMIT clause, so only that page of
+        records is fetched. Records come back in set order unless `order_by`
+        names a field to sort on; sets have no stable order, so anything
+        paged must name one.
+        """
+        args = {"by": "nosort", "get": [f"{prefix}*->{name}" for name in fields]}
+        if order_by:
+            args.update(by=f"{prefix}*->{order_by}", alpha=True)
+        if offset or limit is not None:
+            # A negative count means everything after the offset
+            args.update(start=offset, num=-1 if limit is None else limit)
+        return args
+    
+    def _rows(self, values: list, fields) -> List[dict]:
+        """Reshape a flat SORT ... GET reply into one dict per record
+        
+        Ids left in a set after their record was deleted come back as all-None
+        rows and are skipped.
+        """
+        width = len(fields)
+        rows = []
+        for start in range(0, len(values), width):
+            if values[start] is not None:
+                rows.append(dict(zip(fields, values[start:start + width])))
+        return rows
+    
+    def _sort_fetch(self, key: str, prefix: str, fields, offset: int = 0,
+                    limit: Optional[int] = None, order_by: Optional[str] = None) -> List[dict]:
+        """Fetch every record whose id is in set `key` with a single SORT command"""
+        args = self._sort_args(prefix, fields, offset, limit, order_by)
+        return self._rows(self.redis.sort(key, **args), fields)
+    
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get a job by ID"""
+        return self._load_job(self.redis.hgetall(f"{self.JOB_PREFIX}{job_id}"))
+    
+    def get_jobs(self, job_ids: List[str]) -> List[Job]:
+        """Get several jobs by ID in one round-trip, skipping missing ones"""
+        jobs = [self._load_job(data) for data in self._fetch_many(self.JOB_PREFIX, job_ids)]
+        return [job for job in jobs if job]
+    
+    def get_running_jobs_started_before(self, cutoff: datetime) -> List[Job]:
+        """Get running jobs whose started_at is earlier than `cutoff`"""
+        # cutoff is naive UTC
+        timestamp = cutoff.replace(tzinfo=timezone.utc).timestamp()
+        return self.get_jobs(self.redis.zrangebyscore(self.JOB_RUNNING_INDEX, "-inf", f"({timestamp}"))
+    
+    def update_job(self, job: Job, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing job
+        
+        Pass `fields` to write only those attributes instead of the whole record.
+        """
         with self._lock:
-            data = self.redis.hgetall(f"{self.JOB_PREFIX}{job_id}")
-            if data:
-                # Parse nested JSON fields
-                if 'payload' in data:
-                    data['payload'] = json.loads(data['payload'])
-                if 'result' in data and data['result']:
-                    data['result'] = json.loads(data['result'])
-                return self._deserialize_job(data)
-            return None
-    
-    def update_job(self, job: Job) -> None:
-        """Update an existing job"""
-        with self._lock:
-            if self.redis.exists(f"{self.JOB_PREFIX}{job.job_id}"):
-                job_data = self._serialize_job(job)
-                self.redis.hset(f"{self.JOB_PREFIX}{job.job_id}", mapping=job_data)
+            old_status = self.redis.hget(f"{self.JOB_PREFIX}{job.job_id}", "status")
+            mapping = self._serialize_job(job, fields)
+            if old_status is not None and mapping:
+                pipe = self.redis.pipeline()
+                pipe.hset(f"{self.JOB_PREFIX}{job.job_id}", mapping=mapping)
+                if old_status != job.status.value:
+                    pipe.smove(f"{self.JOB_STATUS_INDEX}{old_status}",
+                               f"{self.JOB_STATUS_INDEX}{job.status.value}", job.job_id)
+                self._index_job_times(pipe, job)
+                pipe.execute()
     
     def delete_job(self, job_id: str) -> bool:
         """Delete a job"""
         with self._lock:
+            old_status, payload = self.redis.hmget(f"{self.JOB_PREFIX}{job_id}", "status", "payload")
+            if old_status is None:
+                self.redis.srem(self.JOB_LIST, job_id)
+                return False
             pipe = self.redis.pipeline()
-            pipe.delete(f"{self.JOB_PREFIX}{job_id}")
-            pipe.srem(self.JOB_LIST, job_id)
+            self._unindex_job(pipe, job_id, old_status, payload)
             result = pipe.execute()
             return result[0] > 0
     
     def list_jobs(self, org_id: Optional[str] = None, 
                   status: Optional[JobStatus] = None,
-                  app_version_id: Optional[str] = None) -> List[Job]:
-        """List jobs with optional filtering"""
-        with self._lock:
-            job_ids = self.redis.smembers(self.JOB_LIST)
-            jobs = []
-            
-            for job_id in job_ids:
-                job = self.get_job(job_id)
-                if job:
-                    # Apply filters
-                    if org_id and job.payload.org_id != org_id:
-                        continue
-                    if status and job.status != status:
-                        continue
-                    if app_version_id and job.payload.app_version_id != app_version_id:
-                        continue
-                    jobs.append(job)
-            
-            return jobs
+                  app_version_id: Optional[str] = None,
+                  offset: int = 0, limit: Optional[int] = None,
+                  target: Optional[JobTarget] = None) -> List[Job]:
+        """List jobs with optional filtering, oldest first
+        
+        `offset` and `limit` select one page of the listing.
+        """
+        index_keys = []
+        if org_id:
+            index_keys.append(f"{self.JOB_ORG_INDEX}{org_id}")
+        if status:
+            index_keys.append(f"{self.JOB_STATUS_INDEX}{status.value}")
+        if app_version_id:
+            index_keys.append(f"{self.JOB_APP_VERSION_INDEX}{app_version_id}")
+        if target:
+            index_keys.append(f"{self.JOB_TARGET_INDEX}{target.value}")
+        
+        # Ids and records come back from one SORT ... GET; several filters
+        # are intersected server-side into a scratch set first
+        if len(index_keys) > 1:
+            pipe = self.redis.pipeline()
+            pipe.sinterstore(self.JOB_FILTER_SCRATCH, index_keys)
+            pipe.sort(self.JOB_FILTER_SCRATCH,
+                      **self._sort_args(self.JOB_PREFIX, self.JOB_FIELDS, offset, limit,
+                                        order_by=self.JOB_ORDER_FIELD))
+            pipe.delete(self.JOB_FILTER_SCRATCH)
+            rows = self._rows(pipe.execute()[1], self.JOB_FIELDS)
+        else:
+            key = index_keys[0] if index_keys else self.JOB_LIST
+            rows = self._sort_fetch(key, self.JOB_PREFIX, self.JOB_FIELDS, offset, limit,
+                                    order_by=self.JOB_ORDER_FIELD)
+        
+        return [self._load_job(data) for data in rows]
+    
+    def get_jobs_by_status(self, status: JobStatus) -> List[Job]:
+        """Get all jobs with a specific status"""
+        return self.list_jobs(status=status)
     
     # Group operations
     def add_group(self, group: JobGroup) -> None:
@@ -227,67 +640,99 @@ class RedisJobStore:
             group_data = self._serialize_group(group)
             pipe.hset(f"{self.GROUP_PREFIX}{group.group_id}", mapping=group_data)
             pipe.sadd(self.GROUP_LIST, group.group_id)
+            pipe.sadd(self._group_index_key(group.org_id, group.app_version_id, group.status),
+                      group.group_id)
+            pipe.sadd(f"{self.GROUP_STATUS_INDEX}{group.status.value}", group.group_id)
             pipe.execute()
     
+    def _load_group(self, data: dict) -> Optional[JobGroup]:
+        """Build a group from its raw hash, or None if the hash was empty"""
+        if data:
+            # Parse jobs list into the group's ordered id set
+            if 'jobs' in data:
+                data['jobs'] = dict.fromkeys(orjson.loads(data['jobs']))
+            return self._deserialize_group(data)
+        return None
+    
     def get_group(self, group_id: str) -> Optional[JobGroup]:
         """Get a job group by ID"""
+        return self._load_group(self.redis.hgetall(f"{self.GROUP_PREFIX}{group_id}"))
+    
+    def update_group(self, group: JobGroup, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing job group
+        
+        Pass `fields` to write only those attributes instead of the whole record.
+        """
         with self._lock:
-            data = self.redis.hgetall(f"{self.GROUP_PREFIX}{group_id}")
-            if data:
-                # Parse jobs list
-                if 'jobs' in data:
-                    data['jobs'] = json.loads(data['jobs'])
-                return self._deserialize_group(data)
-            return None
-    
-    def update_group(self, group: JobGroup) -> None:
-        """Update an existing job group"""
-        with self._lock:
-            if self.redis.exists(f"{self.GROUP_PREFIX}{group.group_id}"):
-                group_data = self._serialize_group(group)
-                self.redis.hset(f"{self.GROUP_PREFIX}{group.group_id}", mapping=group_data)
+            old_status = self.redis.hget(f"{self.GROUP_PREFIX}{group.group_id}", "status")
+            mapping = self._serialize_group(group, fields)
+            if old_status is not None and mapping:
+                pipe = self.redis.pipeline()
+                pipe.hset(f"{self.GROUP_PREFIX}{group.group_id}", mapping=mapping)
+                if old_status != group.status.value:
+                    pipe.smove(
+                        self._group_index_key(group.org_id, group.app_version_id, _STATUS_BY_VALUE[old_status]),
+                        self._group_index_key(group.org_id, group.app_version_id, group.status),
+                        group.group_id)
+                    pipe.smove(f"{self.GROUP_STATUS_INDEX}{old_status}",
+                               f"{self.GROUP_STATUS_INDEX}{group.status.value}", group.group_id)
+                pipe.execute()
     
     def delete_group(self, group_id: str) -> bool:
         """Delete a job group"""
         with self._lock:
+            group = self.get_group(group_id)
             pipe = self.redis.pipeline()
             pipe.delete(f"{self.GROUP_PREFIX}{group_id}")
             pipe.srem(self.GROUP_LIST, group_id)
+            if group:
+                pipe.srem(self._group_index_key(group.org_id, group.app_version_id, group.status),
+                          group_id)
+                pipe.srem(f"{self.GROUP_STATUS_INDEX}{group.status.value}", group_id)
             result = pipe.execute()
             return result[0] > 0
     
     def list_groups(self, org_id: Optional[str] = None,
                     status: Optional[JobStatus] = None) -> List[JobGroup]:
         """List job groups with optional filtering"""
-        with self._lock:
-            group_ids = self.redis.smembers(self.GROUP_LIST)
-            groups = []
-            
-            for group_id in group_ids:
-                group = self.get_group(group_id)
-                if group:
-                    # Apply filters
-                    if org_id and group.org_id != org_id:
-                        continue
-                    if status and group.status != status:
-                        continue
-                    groups.append(group)
-            
-            return groups
+        groups = []
+        
+        key = f"{self.GROUP_STATUS_INDEX}{status.value}" if status else self.GROUP_LIST
+        for data in self._sort_fetch(key, self.GROUP_PREFIX, self.GROUP_FIELDS):
+            group = self._load_group(data)
+            if group:
+                # Apply filters
+                if org_id and group.org_id != org_id:
+                    continue
+                if status and group.status != status:
+                    continue
+                groups.append(group)
+        
+        return groups
     
     def find_group_by_app_version(self, org_id: str, app_version_id: str) -> Optional[JobGroup]:
         """Find an existing pending group for the same app version"""
-        with self._lock:
-            groups = self.list_groups(org_id=org_id, status=JobStatus.PENDING)
-            for group in groups:
-                if group.app_version_id == app_version_id:
-                    return group
-            return None
+        pending_key = self._group_index_key(org_id, app_version_id, JobStatus.PENDING)
+        for data in self._sort_fetch(pending_key, self.GROUP_PREFIX, self.GROUP_FIELDS):
+            group = self._load_group(data)
+            if group:
+                return group
+        return None
     
     def get_group_by_app_version(self, org_id: str, app_version_id: str) -> Optional[JobGroup]:
         """Alias for find_group_by_app_version for compatibility"""
         return self.find_group_by_app_version(org_id, app_version_id)
     
+    def add_job_to_group(self, job_id: str, group_id: str) -> bool:
+        """Add a job to an existing group"""
+        with self._lock:
+            group = self.get_group(group_id)
+            if group and job_id not in group.jobs:
+                group.jobs[job_id] = None
+                self.update_group(group, fields=("jobs",))
+                return True
+            return False
+    
     # Worker operations
     def add_worker(self, worker: Worker) -> None:
         """Add a new worker"""
@@ -296,110 +741,194 @@ class RedisJobStore:
             worker_data = self._serialize_worker(worker)
             pipe.hset(f"{self.WORKER_PREFIX}{worker.worker_id}", mapping=worker_data)
             pipe.sadd(self.WORKER_LIST, worker.worker_id)
+            pipe.hincrby(self.WORKER_STATUS_COUNTS, worker.status, 1)
+            self._index_heartbeat(pipe, worker)
+            self._index_idle(pipe, worker, None)
             pipe.execute()
     
+    def _load_worker(self, data: dict) -> Optional[Worker]:
+        """Build a worker from its raw hash, or None if the hash was empty"""
+        if data:
+            # Parse nested JSON fields
+            if 'target_types' in data:
+                data['target_types'] = orjson.loads(data['target_types'])
+            if 'current_jobs' in data:
+                data['current_jobs'] = dict.fromkeys(orjson.loads(data['current_jobs']))
+            if 'metadata' in data:
+                data['metadata'] = orjson.loads(data['metadata'])
+            return self._deserialize_worker(data)
+        return None
+    
     def get_worker(self, worker_id: str) -> Optional[Worker]:
         """Get a worker by ID"""
+        return self._load_worker(self.redis.hgetall(f"{self.WORKER_PREFIX}{worker_id}"))
+    
+    def update_worker(self, worker: Worker, fields: Optional[Iterable[str]] = None) -> None:
+        """Update an existing worker
+        
+        Pass `fields` to write only those attributes instead of the whole record.
+        """
+        if fields is not None and tuple(fields) == ("last_heartbeat",):
+            # Heartbeats are the most frequent write; one script call
+            # replaces the status read and the pipeline
+            self._touch_worker(
+                keys=[f"{self.WORKER_PREFIX}{worker.worker_id}", self.WORKER_HEARTBEAT_INDEX],
+                args=[worker.worker_id, _encode_datetime(worker.last_heartbeat),
+                      worker.last_heartbeat.replace(tzinfo=timezone.utc).timestamp()])
+            return
+        
         with self._lock:
-            data = self.redis.hgetall(f"{self.WORKER_PREFIX}{worker_id}")
-            if data:
-                # Parse nested JSON fields
-                if 'target_types' in data:
-                    data['target_types'] = json.loads(data['target_types'])
-                if 'current_jobs' in data:
-                    data['current_jobs'] = json.loads(data['current_jobs'])
-                if 'metadata' in data:
-                    data['metadata'] = json.loads(data['metadata'])
-                return self._deserialize_worker(data)
-            return None
-    
-    def update_worker(self, worker: Worker) -> None:
-        """Update an existing worker"""
-        with self._lock:
-            if self.redis.exists(f"{self.WORKER_PREFIX}{worker.worker_id}"):
-                worker_data = self._serialize_worker(worker)
-                self.redis.hset(f"{self.WORKER_PREFIX}{worker.worker_id}", mapping=worker_data)
+            old_status = self.redis.hget(f"{self.WORKER_PREFIX}{worker.worker_id}", "status")
+            mapping = self._serialize_worker(worker, fields)
+            if old_status is not None and mapping:
+                pipe = self.redis.pipeline()
+                pipe.hset(f"{self.WORKER_PREFIX}{worker.worker_id}", mapping=mapping)
+                self._index_heartbeat(pipe, worker)
+                if old_status != worker.status:
+                    pipe.hincrby(self.WORKER_STATUS_COUNTS, old_status, -1)
+                    pipe.hincrby(self.WORKER_STATUS_COUNTS, worker.status, 1)
+                    self._index_idle(pipe, worker, old_status)
+                pipe.execute()
     
     def delete_worker(self, worker_id: str) -> bool:
         """Delete a worker"""
         with self._lock:
+            old_status = self.redis.hget(f"{self.WORKER_PREFIX}{worker_id}", "status")
             pipe = self.redis.pipeline()
             pipe.delete(f"{self.WORKER_PREFIX}{worker_id}")
             pipe.srem(self.WORKER_LIST, worker_id)
+            pipe.zrem(self.WORKER_HEARTBEAT_INDEX, worker_id)
+            if old_status is not None:
+                pipe.hincrby(self.WORKER_STATUS_COUNTS, old_status, -1)
+            for target in JobTarget:
+                pipe.zrem(f"{self.WORKER_IDLE_INDEX}{target.value}", worker_id)
             result = pipe.execute()
             return result[0] > 0
     
     def list_workers(self, target_type: Optional[JobTarget] = None,
                      status: Optional[str] = None) -> List[Worker]:
         """List workers with optional filtering"""
-        with self._lock:
-            worker_ids = self.redis.smembers(self.WORKER_LIST)
-            workers = []
-            
-            for worker_id in worker_ids:
-                worker = self.get_worker(worker_id)
-                if worker:
-                    # Apply filters
-                    if target_type and target_type not in worker.target_types:
-                        continue
-                    if status and worker.status != status:
-                        continue
-                    workers.append(worker)
-            
-            return workers
+        workers = []
+        
+        for data in self._sort_fetch(self.WORKER_LIST, self.WORKER_PREFIX, self.WORKER_FIELDS):
+            worker = self._load_worker(data)
+            if worker:
+                # Apply filters
+                if target_type and not worker.target_mask & TARGET_BITS[target_type]:
+                    continue
+                if status and worker.status != status:
+                    continue
+                workers.append(worker)
+        
+        return workers
+    
+    def get_workers_with_heartbeat_before(self, cutoff: datetime) -> List[Worker]:
+        """Get workers whose last heartbeat is earlier than `cutoff`"""
+        # cutoff is naive UTC
+        timestamp = cutoff.replace(tzinfo=timezone.utc).timestamp()
+        worker_ids = self.redis.zrangebyscore(self.WORKER_HEARTBEAT_INDEX, "-inf", f"({timestamp}")
+        workers = [self._load_worker(data) for data in self._fetch_many(self.WORKER_PREFIX, worker_ids)]
+        return [worker for worker in workers if worker]
     
     def get_available_workers(self, target_type: JobTarget) -> List[Worker]:
         """Get workers that can handle a specific target type and are available"""
-        with self._lock:
-            workers = self.list_workers(target_type=target_type, status="idle")
-            return [w for w in workers if len(w.current_jobs) == 0]
+        worker_ids = self.redis.zrange(f"{self.WORKER_IDLE_INDEX}{target_type.value}", 0, -1)
+        workers = [self._load_worker(data) for data in self._fetch_many(self.WORKER_PREFIX, worker_ids)]
+        return [w for w in workers if w and w.status == "idle" and len(w.current_jobs) == 0]
+    
+    def _assign_keys(self, job_id: str, worker_id: str) -> List[str]:
+        """KEYS for the assignment script"""
+        return [f"{self.WORKER_PREFIX}{worker_id}", f"{self.JOB_PREFIX}{job_id}",
+                self.WORKER_STATUS_COUNTS, f"{self.JOB_STATUS_INDEX}{JobStatus.PENDING.value}",
+                f"{self.JOB_STATUS_INDEX}{JobStatus.QUEUED.value}", *self._idle_index_keys]
     
     def assign_job_to_worker(self, job_id: str, worker_id: str) -> bool:
-        """Assign a job to a worker"""
-        with self._lock:
-            worker = self.get_worker(worker_id)
-            job = self.get_job(job_id)
-            
-            if worker and job:
-                if job_id not in worker.current_jobs:
-                    worker.current_jobs.append(job_id)
-                    worker.status = "busy"
-                    self.update_worker(worker)
-                
-                job.worker_id = worker_id
-                job.status = JobStatus.QUEUED
-                job.updated_at = datetime.utcnow()
-                self.update_job(job)
-                return True
-            return False
+        """Assign a pending, unassigned job to a worker"""
+        assigned = self._assign_job(
+            keys=self._assign_keys(job_id, worker_id),
+            args=[job_id, worker_id, datetime.utcnow().isoformat(),
+                  JobStatus.PENDING.value, JobStatus.QUEUED.value])
+        return bool(assigned)
     
-    def get_statistics(self) -> Dict:
-        """Get system statistics"""
+    def assign_jobs_to_worker(self, job_ids: List[str], worker_id: str) -> List[str]:
+        """Assign several jobs to one worker, returning the IDs assigned"""
+        # One round-trip for the whole group; each script call stays atomic
+        now = datetime.utcnow().isoformat()
+        pipe = self.redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            self._assign_job(
+                keys=self._assign_keys(job_id, worker_id),
+                args=[job_id, worker_id, now, JobStatus.PENDING.value, JobStatus.QUEUED.value],
+                client=pipe)
+        return [job_id for job_id, assigned in zip(job_ids, pipe.execute()) if assigned]
+    
+    def complete_job_for_worker(self, job_id: str, worker_id: str) -> bool:
+        """Remove a completed job from worker's current jobs"""
+        completed = self._complete_job(
+            keys=[f"{self.WORKER_PREFIX}{worker_id}", self.WORKER_STATUS_COUNTS,
+                  *self._idle_index_keys],
+            args=[job_id, worker_id, time.time(), *self._target_values])
+        return bool(completed)
+    
+    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
+        """Clean up old completed/failed jobs"""
+        cutoff = time.time() - max_age_hours * 3600
         with self._lock:
-            jobs = self.list_jobs()
-            groups = self.list_groups()
-            workers = self.list_workers()
+            job_ids = self.redis.zrangebyscore(self.JOB_COMPLETED_INDEX, "-inf", f"({cutoff}")
+            if not job_ids:
+                return 0
             
-            job_status_counts = {}
-            for status in JobStatus:
-                job_status_counts[status.value] = len([j for j in jobs if j.status == status])
-            
-            idle_workers = len([w for w in workers if w.status == "idle"])
-            busy_workers = len([w for w in workers if w.status == "busy"])
+            pipe = self.redis.pipeline(transaction=False)
+            for job_id in job_ids:
+                pipe.hmget(f"{self.JOB_PREFIX}{job_id}", "status", "payload")
+            records = pipe.execute()
             
-            return {
-                "total_jobs": len(jobs),
-                "pending": job_status_counts.get("pending", 0),
-                "queued": job_status_counts.get("queued", 0),
-                "running": job_status_counts.get("running", 0),
-                "completed": job_status_counts.get("completed", 0),
-                "failed": job_status_counts.get("failed", 0),
-                "cancelled": job_status_counts.get("cancelled", 0),
-                "total_groups": len(groups),
-                "total_workers": len(workers),
-                "idle_workers": idle_workers,
-                "busy_workers": busy_workers
-            }
+            # Entries for jobs deleted or retried since they finished are
+            # dropped from the index without touching the job
+            removed = 0
+            terminal = {status.value for status in TERMINAL_STATES}
+            pipe = self.redis.pipeline()
+            for job_id, (status, payload) in zip(job_ids, records):
+                if status in terminal:
+                    self._unindex_job(pipe, job_id, status, payload)
+                    removed += 1
+                else:
+                    pipe.zrem(self.JOB_COMPLETED_INDEX, job_id)
+            pipe.execute()
+            return removed
+    
+    def get_statistics(self) -> Dict:
+        """Get system statistics from the maintained counters"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.scard(self.JOB_LIST)
+        pipe.scard(self.GROUP_LIST)
+        pipe.scard(self.WORKER_LIST)
+        pipe.hgetall(self.WORKER_STATUS_COUNTS)
+        # Active workers are a score range of the heartbeat index
+        pipe.zcount(self.WORKER_HEARTBEAT_INDEX, time.time() - self.heartbeat_timeout, "+inf")
+        for status in JobStatus:
+            pipe.scard(f"{self.JOB_STATUS_INDEX}{status.value}")
+        (total_jobs, total_groups, total_workers, worker_counts, active_workers,
+         *job_counts) = pipe.execute()
+        
+        stats = {"total_jobs": total_jobs}
+        for status, count in zip(JobStatus, job_counts):
+            stats[status.value] = count
+        
+        idle_workers = int(worker_counts.get("idle", 0))
+        busy_workers = int(worker_counts.get("busy", 0))
+        stats.update({
+            "total_groups": total_groups,
+            "total_workers": total_workers,
+            "idle_workers": idle_workers,
+            "busy_workers": busy_workers,
+            "active_workers": active_workers
+        })
+        return stats
+    
+    def get_queue_stats(self) -> Dict:
+        """Alias for get_statistics for compatibility with JobStore"""
+        return self.get_statistics()
     
     def clear_all(self) -> None:
         """Clear all data - useful for testing"""
@@ -423,6 +952,19 @@ class RedisJobStore:
             for worker_id in worker_ids:
                 pipe.delete(f"{self.WORKER_PREFIX}{worker_id}")
             pipe.delete(self.WORKER_LIST)
+            pipe.delete(self.WORKER_HEARTBEAT_INDEX)
+            pipe.delete(self.JOB_COMPLETED_INDEX)
+            pipe.delete(self.JOB_RUNNING_INDEX)
+            
+            # Delete indexes and reset counters
+            for pattern in (f"{self.JOB_ORG_INDEX}*", f"{self.JOB_STATUS_INDEX}*",
+                            f"{self.JOB_APP_VERSION_INDEX}*", f"{self.JOB_TARGET_INDEX}*",
+                            "idx:group:*", f"{self.WORKER_IDLE_INDEX}*"):
+                for key in self.redis.scan_iter(match=pattern):
+                    pipe.delete(key)
+            pipe.delete(self.WORKER_STATUS_COUNTS)
+            pipe.hset(self.WORKER_STATUS_COUNTS, mapping={"idle": 0, "busy": 0, "offline": 0})
+            pipe.set(self.INDEXES_INITIALIZED, self.INDEX_VERSION)
             
             pipe.execute()
             logger.info("Cleared all Redis data") 
\ No newline at end of file
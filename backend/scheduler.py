@@ -7,23 +7,35 @@ This module handles the core scheduling logic:
 - Handles priority scheduling and load balancing
 """
 
+import heapq
 import threading
 import time
-from typing import Dict, List, Optional, Set
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
 import logging
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from shared import JobStatus, JobTarget, JobPriority, Job, JobGroup, Worker, generate_group_id
-from job_store import JobStore
+from shared import (JobStatus, JobTarget, JobPriority, PRIORITY_WEIGHTS, Job, JobGroup, Worker,
+                    generate_group_id)
+from .job_store import JobStore, TERMINAL_STATES
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Jobs in these states are held by a worker
+_ASSIGNED_STATES = frozenset({JobStatus.QUEUED, JobStatus.RUNNING})
+
+# Scheduler-driven job transitions, (status, event) -> new status. Pairs
+# not listed are not allowed; a job out of retries fails rather than
+# returning to PENDING.
+_TRANSITIONS: Dict[Tuple[JobStatus, str], JobStatus] = {
+    **{(status, "worker_lost"): JobStatus.PENDING for status in _ASSIGNED_STATES},
+    (JobStatus.RUNNING, "timeout"): JobStatus.FAILED,
+    (JobStatus.FAILED, "retry"): JobStatus.PENDING,
+    **{(status, "cancel"): JobStatus.CANCELLED
+       for status in JobStatus if status not in TERMINAL_STATES},
+}
+
 
 class JobScheduler:
     """Job scheduler that groups jobs by app_version_id and assigns to workers"""
@@ -34,34 +46,77 @@ class JobScheduler:
         self._scheduler_thread = None
         self._lock = threading.RLock()
         
+        # Wakes the scheduler loop as soon as new work is queued; the
+        # schedule interval remains as a safety-net tick
+        self._cv = threading.Condition()
+        self._work_pending = False
+        self._subscriber = None
+        
+        # Signals long-polling heartbeats whenever jobs are assigned; the
+        # generation counter lets waiters detect assignments they missed
+        self._assigned_cv = threading.Condition()
+        self._assignment_generation = 0
+        
+        # Same scheme for job status changes, waited on by event streams
+        self._job_cv = threading.Condition()
+        self._job_generation = 0
+        
+        # Pending groups as a min-heap of (aged rank, weight, group_id), with
+        # each group's current weight alongside. Entries go stale when a
+        # group is assigned or its weight rises; they are skipped on pop
+        # rather than removed.
+        self._pending_heap: List[Tuple[float, int, str]] = []
+        self._pending_weights: Dict[str, int] = {}
+        
         # Scheduling configuration
         self.schedule_interval = 5  # seconds
         self.worker_timeout = 300   # 5 minutes
         self.max_retries = 3
-        
-        # Priority weights for scheduling
-        self.priority_weights = {
-            JobPriority.URGENT: 4,
-            JobPriority.HIGH: 3,
-            JobPriority.NORMAL: 2,
-            JobPriority.LOW: 1
-        }
+        # How often the heap is reseeded from the store, to pick up groups
+        # created by schedulers in other processes sharing it
+        self.resync_interval = 60  # seconds
+        # Waiting this long is worth one priority level, so low-priority
+        # groups cannot be starved by a steady stream of higher ones
+        self.priority_aging = 300  # seconds
+        self._last_resync: Optional[float] = None
+        # Stale workers and timed-out jobs are swept on this cadence, not on
+        # every wakeup; both timeouts are minutes long
+        self.maintenance_interval = 15  # seconds
+        self._next_maintenance = 0.0
     
     def start(self) -> None:
         """Start the scheduler background thread"""
         if not self._running:
             self._running = True
+            # The first pass seeds the heap with groups left pending in the store
+            self._last_resync = None
+            self._next_maintenance = 0.0
             self._scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
             self._scheduler_thread.start()
+            
+            # Stores shared between processes (Redis) announce new jobs so
+            # every scheduler wakes, not just the one that took the request
+            if hasattr(self.job_store, 'subscribe_new_jobs'):
+                self._subscriber = self.job_store.subscribe_new_jobs(self.notify)
             logger.info("Job scheduler started")
     
     def stop(self) -> None:
         """Stop the scheduler"""
         self._running = False
+        if self._subscriber:
+            self._subscriber.stop()
+            self._subscriber = None
+        self.notify()
         if self._scheduler_thread:
             self._scheduler_thread.join()
         logger.info("Job scheduler stopped")
     
+    def notify(self) -> None:
+        """Wake the scheduler loop to schedule newly queued work"""
+        with self._cv:
+            self._work_pending = True
+            self._cv.notify()
+    
     def queue_job(self, job: Job) -> None:
         """Queue a new job for scheduling"""
         with self._lock:
@@ -78,7 +133,7 @@ class JobScheduler:
                     group_id=group_id,
                     org_id=job.payload.org_id,
                     app_version_id=job.payload.app_version_id,
-                    jobs=[job.job_id]
+                    jobs={job.job_id: None}
                 )
                 self.job_store.add_group(group)
                 logger.info(f"Created new job group {group_id} for app_version_id {job.payload.app_version_id}")
@@ -87,150 +142,333 @@ class JobScheduler:
                 self.job_store.add_job_to_group(job.job_id, group.group_id)
                 logger.info(f"Added job {job.job_id} to existing group {group.group_id}")
             
-            # Update job status
-            job.status = JobStatus.PENDING
-            job.updated_at = datetime.utcnow()
-            self.job_store.update_job(job)
+            self._enqueue_group(group, job.payload.priority_weight)
+            
+            # New and retried jobs arrive already pending and stamped, so the
+            # write-back (a clock read and a store round-trip) is only needed
+            # for anything else
+            if job.status != JobStatus.PENDING:
+                job.status = JobStatus.PENDING
+                job.updated_at = datetime.utcnow()
+                self.job_store.update_job(job, fields=("status", "updated_at"))
+        
+        self.notify()
+    
+    def queue_jobs(self, jobs: List[Job]) -> None:
+        """Queue a batch of newly submitted jobs in a single scheduler pass"""
+        with self._lock:
+            # Bucket the batch by (org_id, app_version_id) so each group is
+            # looked up or created once rather than once per job
+            buckets: Dict[tuple, List[Job]] = {}
+            for job in jobs:
+                key = (job.payload.org_id, job.payload.app_version_id)
+                buckets.setdefault(key, []).append(job)
+            
+            for (org_id, app_version_id), bucket in buckets.items():
+                group = self.job_store.get_group_by_app_version(org_id, app_version_id)
+                
+                if not group:
+                    group_id = generate_group_id()
+                    group = JobGroup(
+                        group_id=group_id,
+                        org_id=org_id,
+                        app_version_id=app_version_id,
+                        jobs=dict.fromkeys(job.job_id for job in bucket)
+                    )
+                    self.job_store.add_group(group)
+                    logger.info(f"Created new job group {group_id} for app_version_id {app_version_id} "
+                                f"with {len(bucket)} jobs")
+                else:
+                    for job in bucket:
+                        self.job_store.add_job_to_group(job.job_id, group.group_id)
+                    logger.info(f"Added {len(bucket)} jobs to existing group {group.group_id}")
+                
+                self._enqueue_group(group, max(job.payload.priority_weight for job in bucket))
+        
+        self.notify()
+    
+    def _enqueue_group(self, group: JobGroup, weight: int) -> None:
+        """Put a group on the pending heap, or raise its weight if already there"""
+        if weight > self._pending_weights.get(group.group_id, 0):
+            self._pending_weights[group.group_id] = weight
+            heapq.heappush(self._pending_heap, (self._aged_rank(group, weight), weight, group.group_id))
+    
+    def _aged_rank(self, group: JobGroup, weight: int) -> float:
+        """Heap key for a pending group; lower is scheduled first
+        
+        The effective priority is weight + waited / priority_aging. Since
+        every group ages at the same rate, ordering by that is the same as
+        ordering by weight - created / priority_aging, which never changes,
+        so aging needs no per-tick updates.
+        """
+        # created_at is naive UTC
+        created = group.created_at.replace(tzinfo=timezone.utc).timestamp()
+        return created / self.priority_aging - weight
+    
+    def _resync_pending_groups(self) -> None:
+        """Seed the pending heap from every pending group in the store"""
+        for group in self.job_store.list_groups(status=JobStatus.PENDING):
+            if group.status == JobStatus.PENDING and group.jobs:
+                self._enqueue_group(group, self._get_group_priority(group))
+        self._last_resync = time.monotonic()
     
     def get_next_job_for_worker(self, worker: Worker) -> Optional[Job]:
         """Get the next job for a specific worker"""
         with self._lock:
-            # Find jobs that this worker can handle
-            available_jobs = []
-            
-            for job in self.job_store.get_jobs_by_status(JobStatus.QUEUED):
-                if (job.payload.target in worker.target_types and 
-                    job.worker_id == worker.worker_id):
-                    available_jobs.append(job)
-            
-            if available_jobs:
-                # Sort by priority and creation time
-                available_jobs.sort(
-                    key=lambda j: (
-                        -self.priority_weights.get(j.payload.priority, 1),
-                        j.created_at
-                    )
+            # Only jobs assigned to this worker can be its next job, so look
+            # at its own list rather than every queued job. Re-read the
+            # worker: a long-polling caller's copy predates new assignments.
+            current = self.job_store.get_worker(worker.worker_id)
+            if not current:
+                return None
+            
+            available_jobs = [
+                job for job in self.job_store.get_jobs(current.current_jobs)
+                if (job.status == JobStatus.QUEUED and
+                    job.worker_id == worker.worker_id and
+                    job.payload.target_mask & worker.target_mask)
+            ]
+            
+            # Highest priority first, then oldest
+            return min(
+                available_jobs,
+                key=lambda j: (
+                    -j.payload.priority_weight,
+                    j.created_at
+                ),
+                default=None
+            )
+    
+    def wait_for_work(self, worker: Worker, timeout: float) -> Optional[Job]:
+        """Get the next job for a worker, blocking up to `timeout` seconds for one"""
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            with self._assigned_cv:
+                generation = self._assignment_generation
+            
+            job = self.get_next_job_for_worker(worker)
+            if job:
+                return job
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            
+            # Re-check at least every schedule interval in case the job was
+            # assigned by a scheduler in another process
+            with self._assigned_cv:
+                self._assigned_cv.wait_for(
+                    lambda: self._assignment_generation != generation,
+                    timeout=min(remaining, self.schedule_interval)
                 )
-                return available_jobs[0]
+    
+    def notify_job_changed(self) -> None:
+        """Wake event streams waiting on a job status change"""
+        with self._job_cv:
+            self._job_generation += 1
+            self._job_cv.notify_all()
+    
+    def wait_for_job_change(self, job_id: str, status: JobStatus,
+                            timeout: float) -> Optional[Job]:
+        """Get a job once its status is no longer `status`, blocking up to `timeout` seconds
+        
+        Returns the job as it stands when the wait ends, changed or not, or
+        None if it no longer exists.
+        """
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            with self._job_cv:
+                generation = self._job_generation
             
-            return None
+            job = self.job_store.get_job(job_id)
+            if not job or job.status != status:
+                return job
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return job
+            
+            # Re-check at least every schedule interval in case the job was
+            # updated by another process
+            with self._job_cv:
+                self._job_cv.wait_for(
+                    lambda: self._job_generation != generation,
+                    timeout=min(remaining, self.schedule_interval)
+                )
     
     def _scheduler_loop(self) -> None:
         """Main scheduler loop"""
         while self._running:
+            failed = False
             try:
                 self._schedule_jobs()
-                self._cleanup_stale_workers()
-                self._handle_failed_jobs()
-                time.sleep(self.schedule_interval)
+                if time.monotonic() >= self._next_maintenance:
+                    # Both maintenance passes share one timestamp per tick
+                    now = datetime.utcnow()
+                    self._cleanup_stale_workers(now)
+                    self._handle_failed_jobs(now)
+                    self._next_maintenance = time.monotonic() + self.maintenance_interval
             except Exception as e:
                 logger.error(f"Scheduler error: {e}")
-                time.sleep(self.schedule_interval)
+                failed = True
+            
+            # Sleep until new work is queued or timed work falls due. The
+            # deadlines only advance when their pass succeeds, so after an
+            # error (e.g. the store is unreachable) wait at least
+            # schedule_interval instead of retrying immediately.
+            with self._cv:
+                if failed or not self._work_pending:
+                    timeout = self._seconds_until_due()
+                    if failed:
+                        timeout = max(timeout, self.schedule_interval)
+                    self._cv.wait(timeout=timeout)
+                self._work_pending = False
+    
+    def _seconds_until_due(self) -> float:
+        """Seconds until the loop next has timed work to do"""
+        # Maintenance and resyncs fall due on their own cadence
+        deadlines = [self._next_maintenance, (self._last_resync or 0.0) + self.resync_interval]
+        if self._pending_weights:
+            # Workers freed by another process do not wake this one, so keep
+            # retrying waiting groups on the schedule interval
+            deadlines.append(time.monotonic() + self.schedule_interval)
+        return max(min(deadlines) - time.monotonic(), 0.0)
     
     def _schedule_jobs(self) -> None:
         """Schedule pending jobs to available workers"""
         with self._lock:
-            # Get all pending job groups
-            pending_groups = []
-            all_groups = self.job_store.list_groups()
-            for group in all_groups:
-                if group.status == JobStatus.PENDING and group.jobs:
-                    pending_groups.append(group)
-            
-            if not pending_groups:
-                return
-            
-            # Sort groups by priority (based on highest priority job in group)
-            pending_groups.sort(key=self._get_group_priority, reverse=True)
-            
-            # Assign groups to workers
-            for group in pending_groups:
-                self._assign_group_to_worker(group)
+            if (self._last_resync is None or
+                    time.monotonic() - self._last_resync >= self.resync_interval):
+                self._resync_pending_groups()
+            
+            # Pop pending groups in priority order (highest-priority job in
+            # the group, aged by time waiting); those no worker could take
+            # yet go back on the heap for the next pass
+            heap = self._pending_heap
+            waiting = []
+            # Available workers are fetched once per target for the whole
+            # pass and handed out in order; taken tracks workers already given
+            # a group so a multi-target worker is not assigned twice
+            available: Dict[JobTarget, List[Worker]] = {}
+            taken: Set[str] = set()
+            while heap:
+                entry = heapq.heappop(heap)
+                _, weight, group_id = entry
+                if self._pending_weights.get(group_id) != weight:
+                    continue
+                
+                group = self.job_store.get_group(group_id)
+                if not group or group.status != JobStatus.PENDING or not group.jobs:
+                    del self._pending_weights[group_id]
+                    continue
+                
+                if self._assign_group_to_worker(group, available, taken):
+                    del self._pending_weights[group_id]
+                else:
+                    waiting.append(entry)
+            
+            for entry in waiting:
+                heapq.heappush(heap, entry)
     
     def _get_group_priority(self, group: JobGroup) -> int:
         """Calculate priority score for a job group"""
-        max_priority = JobPriority.LOW
-        
-        for job_id in group.jobs:
-            job = self.job_store.get_job(job_id)
-            if job and job.payload.priority.value > max_priority.value:
-                max_priority = job.payload.priority
-        
-        return self.priority_weights.get(max_priority, 1)
+        # One batched fetch rather than a store round-trip per job; each
+        # payload carries its weight, so no per-job enum lookup is needed
+        weights = [job.payload.priority_weight
+                   for job in self.job_store.get_jobs(group.jobs)]
+        return max(weights, default=PRIORITY_WEIGHTS[JobPriority.LOW])
     
-    def _assign_group_to_worker(self, group: JobGroup) -> bool:
+    def _assign_group_to_worker(self, group: JobGroup,
+                                available: Optional[Dict[JobTarget, List[Worker]]] = None,
+                                taken: Optional[Set[str]] = None) -> bool:
         """Assign a job group to an available worker"""
         # Determine target type needed (use first job's target)
         if not group.jobs:
             return False
         
-        first_job = self.job_store.get_job(group.jobs[0])
+        first_job = self.job_store.get_job(next(iter(group.jobs)))
         if not first_job:
             return False
         
         target_type = first_job.payload.target
         
         # Find available workers for this target type
-        available_workers = self.job_store.get_available_workers(target_type)
+        if available is None:
+            available = {}
+        if taken is None:
+            taken = set()
+        available_workers = available.get(target_type)
+        if available_workers is None:
+            available_workers = available[target_type] = (
+                self.job_store.get_available_workers(target_type))
+        while available_workers and available_workers[0].worker_id in taken:
+            available_workers.pop(0)
         
         if not available_workers:
             logger.debug(f"No available workers for target type {target_type.value}")
             return False
         
-        # Select worker (simple round-robin for now)
-        worker = available_workers[0]
+        # Select worker (longest idle first)
+        worker = available_workers.pop(0)
         
-        # Assign all jobs in the group to this worker
-        assigned_jobs = []
-        for job_id in group.jobs:
-            if self.job_store.assign_job_to_worker(job_id, worker.worker_id):
-                assigned_jobs.append(job_id)
+        # Assign all jobs in the group to this worker in one store call
+        assigned_jobs = self.job_store.assign_jobs_to_worker(group.jobs, worker.worker_id)
         
         if assigned_jobs:
+            taken.add(worker.worker_id)
             # Update group status
             group.status = JobStatus.QUEUED
             group.assigned_worker = worker.worker_id
-            self.job_store.update_group(group)
+            self.job_store.update_group(group, fields=("status", "assigned_worker"))
             
             logger.info(f"Assigned group {group.group_id} with {len(assigned_jobs)} jobs to worker {worker.worker_id}")
+            
+            with self._assigned_cv:
+                self._assignment_generation += 1
+                self._assigned_cv.notify_all()
+            self.notify_job_changed()
             return True
         
+        # Nothing was assigned, so the worker stays free for the next group
+        available_workers.insert(0, worker)
         return False
     
-    def _cleanup_stale_workers(self) -> None:
+    def _cleanup_stale_workers(self, now: Optional[datetime] = None) -> None:
         """Mark workers as offline if they haven't sent heartbeat recently"""
-        cutoff_time = datetime.utcnow() - timedelta(seconds=self.worker_timeout)
+        now = now or datetime.utcnow()
+        cutoff_time = now - timedelta(seconds=self.worker_timeout)
         
-        all_workers = self.job_store.list_workers()
-        for worker in all_workers:
-            if (worker.last_heartbeat < cutoff_time and 
-                worker.status != "offline"):
-                
+        # The heartbeat index hands back only workers already past the cutoff
+        for worker in self.job_store.get_workers_with_heartbeat_before(cutoff_time):
+            if worker.status != "offline":
                 logger.warning(f"Worker {worker.worker_id} marked offline due to missing heartbeat")
                 worker.status = "offline"
                 
                 # Reassign any jobs from this worker
-                self._reassign_worker_jobs(worker.worker_id)
+                self._reassign_worker_jobs(worker, now)
                 
-                self.job_store.update_worker(worker)
+                self.job_store.update_worker(worker, fields=("status",))
     
-    def _reassign_worker_jobs(self, worker_id: str) -> None:
+    def _reassign_worker_jobs(self, worker: Worker, now: Optional[datetime] = None) -> None:
         """Reassign jobs from a failed worker"""
-        jobs_to_reassign = []
-        
-        all_jobs = self.job_store.list_jobs()
-        for job in all_jobs:
-            if (job.worker_id == worker_id and 
-                job.status in [JobStatus.QUEUED, JobStatus.RUNNING]):
-                jobs_to_reassign.append(job)
+        worker_id = worker.worker_id
+        # The worker's own job list is the index of what it holds; entries
+        # it has since finished or lost are filtered out by status
+        jobs_to_reassign = [
+            job for job in self.job_store.get_jobs(worker.current_jobs)
+            if job.status in _ASSIGNED_STATES and job.worker_id == worker_id
+        ]
         
+        now = now or datetime.utcnow()
         for job in jobs_to_reassign:
             logger.info(f"Reassigning job {job.job_id} from failed worker {worker_id}")
             
             # Reset job status
             job.worker_id = None
-            job.status = JobStatus.PENDING
-            job.updated_at = datetime.utcnow()
+            job.status = _TRANSITIONS[(job.status, "worker_lost")]
+            job.updated_at = now
             
             # Increment retry count
             job.retry_count += 1
@@ -238,25 +476,26 @@ class JobScheduler:
             if job.retry_count >= job.max_retries:
                 job.status = JobStatus.FAILED
                 job.error_message = f"Max retries exceeded due to worker failures"
-                job.completed_at = datetime.utcnow()
+                job.completed_at = now
             
             self.job_store.update_job(job)
+        
+        if jobs_to_reassign:
+            self.notify_job_changed()
     
-    def _handle_failed_jobs(self) -> None:
+    def _handle_failed_jobs(self, now: Optional[datetime] = None) -> None:
         """Handle jobs that have been running too long or failed"""
-        current_time = datetime.utcnow()
+        current_time = now or datetime.utcnow()
         job_timeout = timedelta(minutes=30)  # 30 minute timeout for jobs
         
-        all_jobs = self.job_store.list_jobs()
-        for job in all_jobs:
-            if (job.status == JobStatus.RUNNING and 
-                job.started_at and 
-                current_time - job.started_at > job_timeout):
-                
+        # Only jobs already past the deadline come back from the running index
+        for job in self.job_store.get_running_jobs_started_before(current_time - job_timeout):
+            new_status = _TRANSITIONS.get((job.status, "timeout"))
+            if new_status:
                 logger.warning(f"Job {job.job_id} timed out after 30 minutes")
                 
                 # Mark job as failed
-                job.status = JobStatus.FAILED
+                job.status = new_status
                 job.error_message = "Job execution timeout"
                 job.completed_at = current_time
                 
@@ -265,13 +504,15 @@ class JobScheduler:
                     self.job_store.complete_job_for_worker(job.job_id, job.worker_id)
                 
                 self.job_store.update_job(job)
+                self.notify_job_changed()
     
     def retry_job(self, job_id: str) -> bool:
         """Retry a failed job"""
         with self._lock:
             job = self.job_store.get_job(job_id)
             
-            if not job or job.status != JobStatus.FAILED:
+            new_status = _TRANSITIONS.get((job.status, "retry")) if job else None
+            if not new_status:
                 return False
             
             if job.retry_count >= job.max_retries:
@@ -279,7 +520,7 @@ class JobScheduler:
                 return False
             
             # Reset job for retry
-            job.status = JobStatus.PENDING
+            job.status = new_status
             job.worker_id = None
             job.started_at = None
             job.completed_at = None
@@ -288,6 +529,7 @@ class JobScheduler:
             job.updated_at = datetime.utcnow()
             
             self.job_store.update_job(job)
+            self.notify_job_changed()
             
             # Re-queue the job
             self.queue_job(job)
@@ -300,22 +542,20 @@ class JobScheduler:
         with self._lock:
             job = self.job_store.get_job(job_id)
             
-            if not job:
-                return False
-            
-            if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
+            new_status = _TRANSITIONS.get((job.status, "cancel")) if job else None
+            if not new_status:
                 return False
             
             # Cancel the job
-            job.status = JobStatus.CANCELLED
-            job.completed_at = datetime.utcnow()
-            job.updated_at = datetime.utcnow()
+            job.status = new_status
+            job.completed_at = job.updated_at = datetime.utcnow()
             
             # Free up worker if assigned
             if job.worker_id:
                 self.job_store.complete_job_for_worker(job.job_id, job.worker_id)
             
             self.job_store.update_job(job)
+            self.notify_job_changed()
             
             logger.info(f"Cancelled job {job_id}")
             return True
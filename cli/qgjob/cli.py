@@ -5,11 +5,17 @@ Command-line interface for submitting and managing AppWright test jobs.
 """
 
 import click
+import orjson
+import re
 import requests
 import time
 import os
 import sys
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Sequence
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
 from colorama import init, Fore, Style
 
@@ -19,15 +25,38 @@ init()
 # Default configuration
 DEFAULT_SERVER_URL = "http://localhost:8080"
 DEFAULT_TIMEOUT = 30
+# Keep-alive connections held open to the server; also caps how many
+# status requests run at once when several jobs are polled together
+DEFAULT_POOL_SIZE = 16
+# Job statuses remembered with their ETag, for conditional re-fetches
+STATUS_CACHE_SIZE = 1024
+# Request bodies are encoded with orjson, so the content type is set by hand
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# Table rows formatted and written per stdout write in `list`
+TABLE_BATCH_ROWS = 100
+# Statuses after which a job no longer changes
+FINAL_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+
+
+class JobDeletedError(click.ClickException):
+    """The server reported, mid-stream, that the watched job was deleted"""
 
 
 class QGJobClient:
     """Client for communicating with the QualGent Job Server"""
     
-    def __init__(self, server_url: str = DEFAULT_SERVER_URL, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, server_url: str = DEFAULT_SERVER_URL, timeout: int = DEFAULT_TIMEOUT,
+                 pool_size: int = DEFAULT_POOL_SIZE):
         self.server_url = server_url.rstrip('/')
         self.timeout = timeout
+        self.pool_size = pool_size
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # job_id -> (etag, job), least recently used first
+        self._status_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._status_cache_lock = threading.Lock()
     
     def submit_job(self, org_id: str, app_version_id: str, test_path: str, 
                    target: str = "emulator", priority: str = "normal") -> Dict[str, Any]:
@@ -43,29 +72,100 @@ class QGJobClient:
         try:
             response = self.session.post(
                 f"{self.server_url}/jobs",
-                json=payload,
+                data=orjson.dumps(payload),
+                headers=JSON_HEADERS,
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise click.ClickException(f"Failed to submit job: {e}")
     
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
-        """Get job status and details"""
+        """Get job status and details
+        
+        Repeat fetches send the last ETag, so an unchanged job costs the
+        server an empty 304 and is served from the cache.
+        """
+        with self._status_cache_lock:
+            cached = self._status_cache.get(job_id)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
         try:
             response = self.session.get(
                 f"{self.server_url}/jobs/{job_id}",
+                headers=headers,
                 timeout=self.timeout
             )
+            if response.status_code == 304 and cached:
+                return cached[1]
             response.raise_for_status()
-            return response.json()
+            job = orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise click.ClickException(f"Failed to get job status: {e}")
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._status_cache_lock:
+                self._status_cache[job_id] = (etag, job)
+                self._status_cache.move_to_end(job_id)
+                if len(self._status_cache) > STATUS_CACHE_SIZE:
+                    self._status_cache.popitem(last=False)
+        return job
+    
+    def get_job_statuses(self, job_ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Get several jobs' status concurrently over the pooled connections"""
+        if len(job_ids) <= 1:
+            return [self.get_job_status(job_id) for job_id in job_ids]
+        with ThreadPoolExecutor(max_workers=min(len(job_ids), self.pool_size)) as executor:
+            # The module-level `list` is the click command, so unpack instead
+            return [*executor.map(self.get_job_status, job_ids)]
+    
+    def stream_job_events(self, job_id: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """Stream a job's state each time its status changes
+        
+        Returns None if the server has no event endpoint or no free stream,
+        so callers can fall back to polling.
+        """
+        try:
+            # The server sends keep-alives well inside the read timeout
+            response = self.session.get(
+                f"{self.server_url}/jobs/{job_id}/events",
+                stream=True,
+                timeout=self.timeout
+            )
+            # No endpoint (older server) or no free stream slot: poll instead
+            if response.status_code in (404, 503):
+                response.close()
+                return None
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise click.ClickException(f"Failed to stream job events: {e}")
+        return self._iter_status_events(response)
+    
+    @staticmethod
+    def _iter_status_events(response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """Parse `status` events out of a server-sent event stream
+        
+        Raises JobDeletedError on a `deleted` event. A dropped connection
+        surfaces as a requests exception while iterating.
+        """
+        with response:
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith('event:'):
+                    event = line[6:].strip()
+                    if event == 'deleted':
+                        raise JobDeletedError("Job was deleted")
+                elif line.startswith('data:') and event == 'status':
+                    yield orjson.loads(line[5:])
+                elif not line:
+                    event = None
     
     def list_jobs(self, org_id: Optional[str] = None, status: Optional[str] = None,
-                  app_version_id: Optional[str] = None) -> Dict[str, Any]:
-        """List jobs with optional filtering"""
+                  app_version_id: Optional[str] = None, limit: Optional[int] = None,
+                  offset: int = 0) -> Dict[str, Any]:
+        """List jobs with optional filtering, one page at a time"""
         params = {}
         if org_id:
             params['org_id'] = org_id
@@ -73,6 +173,10 @@ class QGJobClient:
             params['status'] = status
         if app_version_id:
             params['app_version_id'] = app_version_id
+        if limit is not None:
+            params['limit'] = limit
+        if offset:
+            params['offset'] = offset
         
         try:
             response = self.session.get(
@@ -81,10 +185,31 @@ class QGJobClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise click.ClickException(f"Failed to list jobs: {e}")
     
+    def list_jobs_for_statuses(self, statuses: Sequence[str], org_id: Optional[str] = None,
+                               app_version_id: Optional[str] = None,
+                               limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """List jobs in any of several statuses, one concurrent request per status
+        
+        Results are merged oldest first, then paged with `limit`/`offset`.
+        """
+        # Each status must supply enough jobs to fill the page on its own
+        per_status = None if limit is None else offset + limit
+        
+        def fetch(status):
+            return self.list_jobs(org_id, status, app_version_id, per_status).get('jobs', [])
+        
+        with ThreadPoolExecutor(max_workers=min(len(statuses), self.pool_size)) as executor:
+            pages = [*executor.map(fetch, statuses)]
+        
+        # A job changing status between requests can show up twice
+        merged = {job['job_id']: job for page in pages for job in page}
+        jobs = sorted(merged.values(), key=lambda job: job.get('created_at', ''))
+        return jobs[offset:None if limit is None else offset + limit]
+    
     def get_server_stats(self) -> Dict[str, Any]:
         """Get server statistics"""
         try:
@@ -93,7 +218,7 @@ class QGJobClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise click.ClickException(f"Failed to get server stats: {e}")
     
@@ -105,7 +230,7 @@ class QGJobClient:
                 timeout=self.timeout
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             raise click.ClickException(f"Server health check failed: {e}")
 
@@ -134,22 +259,70 @@ def print_warning(message: str):
 
 def print_info(message: str):
     """Print an info message in blue"""
-    click.echo(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+    click.echo(format_info(message))
 
 
-def format_status(status: str) -> str:
-    """Format job status with colors"""
-    status_colors = {
+def format_info(message: str) -> str:
+    """Format an info message in blue"""
+    return f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}"
+
+
+# Colored status labels, built once rather than for every table row
+_STATUS_FMT = {
+    status: f"{color}{status.upper()}{Style.RESET_ALL}"
+    for status, color in {
         "pending": Fore.YELLOW,
         "queued": Fore.CYAN,
         "running": Fore.BLUE,
         "completed": Fore.GREEN,
         "failed": Fore.RED,
         "cancelled": Fore.MAGENTA
-    }
+    }.items()
+}
+
+
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def echo_grid(headers: Sequence[str], make_rows: Callable[[], Iterable[Sequence[str]]],
+              batch_size: int = TABLE_BATCH_ROWS):
+    """Write a table in tabulate's 'grid' format, a batch of rows at a time
+    
+    `make_rows` is called twice, once to size the columns and once to
+    render them, so neither the rows nor the rendered table are held whole.
+    """
+    # Like tabulate, leave headers two columns of slack
+    widths = [len(header) + 2 for header in headers]
+    for row in make_rows():
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], len(_ANSI_ESCAPE.sub('', cell)))
+    
+    def line(cells):
+        return '| ' + ' | '.join(
+            cell + ' ' * (width - len(_ANSI_ESCAPE.sub('', cell)))
+            for cell, width in zip(cells, widths)
+        ) + ' |\n'
     
-    color = status_colors.get(status.lower(), "")
-    return f"{color}{status.upper()}{Style.RESET_ALL}"
+    rule = '+' + '+'.join('-' * (width + 2) for width in widths) + '+\n'
+    sys.stdout.write(rule + line(headers) + rule.replace('-', '='))
+    
+    batch = []
+    for row in make_rows():
+        batch.append(line(row) + rule)
+        if len(batch) >= batch_size:
+            sys.stdout.write(''.join(batch))
+            batch.clear()
+    sys.stdout.write(''.join(batch))
+    sys.stdout.flush()
+
+
+def format_status(status: str) -> str:
+    """Format job status with colors"""
+    formatted = _STATUS_FMT.get(status)
+    if formatted is None:
+        formatted = _STATUS_FMT.get(status.lower(), f"{status.upper()}{Style.RESET_ALL}")
+    return formatted
 
 
 @click.group()
@@ -205,7 +378,7 @@ def submit(ctx, org_id, app_version_id, test_path, target, priority, wait, poll_
         print_info(f"Status: {format_status(result.get('status', 'unknown'))}")
         
         if wait and job_id:
-            print_info(f"Waiting for job completion (polling every {poll_interval}s)...")
+            print_info("Waiting for job completion...")
             wait_for_completion(client, job_id, poll_interval)
         else:
             print_info(f"Use 'qgjob status --job-id {job_id}' to check status")
@@ -216,66 +389,86 @@ def submit(ctx, org_id, app_version_id, test_path, target, priority, wait, poll_
 
 
 @main.command()
-@click.option('--job-id', required=True, help='Job ID to check')
-@click.option('--watch', is_flag=True, help='Watch job status (refresh every 5 seconds)')
-@click.option('--poll-interval', default=5, help='Polling interval in seconds (when using --watch)')
-def status(job_id, watch, poll_interval):
+@click.option('--job-id', 'job_ids', required=True, multiple=True,
+              help='Job ID to check (repeat to check several jobs)')
+@click.option('--watch', is_flag=True,
+              help='Watch job status (a single job redraws on each change)')
+@click.option('--poll-interval', default=5,
+              help='Polling interval in seconds (when watching several jobs)')
+def status(job_ids, watch, poll_interval):
     """Check job status"""
     client = get_client()
     
     if watch:
-        print_info(f"Watching job {job_id} (refresh every {poll_interval}s, Ctrl+C to stop)...")
         try:
+            if len(job_ids) == 1:
+                print_info("Watching job status (Ctrl+C to stop)...")
+                if watch_job_events(client, job_ids[0]):
+                    print_info("Job finished; stopped watching.")
+                    return
+            
+            # Each event stream holds a server thread, so several jobs (or
+            # a server without streams) are polled instead
+            print_info(f"Watching {len(job_ids)} job(s) (refresh every {poll_interval}s, Ctrl+C to stop)...")
             while True:
-                show_job_status(client, job_id)
+                show_job_statuses(client, job_ids)
                 time.sleep(poll_interval)
         except KeyboardInterrupt:
             print_info("Stopped watching.")
     else:
-        show_job_status(client, job_id)
+        show_job_statuses(client, job_ids)
 
 
 @main.command()
 @click.option('--org-id', help='Filter by organization ID')
-@click.option('--status', help='Filter by job status')
+@click.option('--status', help='Filter by job status (comma-separated for several)')
 @click.option('--app-version-id', help='Filter by app version ID')
 @click.option('--limit', default=20, help='Maximum number of jobs to show')
-def list(org_id, status, app_version_id, limit):
+@click.option('--offset', default=0, help='Number of jobs to skip')
+def list(org_id, status, app_version_id, limit, offset):
     """List jobs with optional filtering"""
     client = get_client()
     
     try:
-        result = client.list_jobs(org_id, status, app_version_id)
-        jobs = result.get('jobs', [])
+        # Ask for one extra job to learn whether there are more to show
+        statuses = [s.strip() for s in status.split(',') if s.strip()] if status else []
+        if len(statuses) > 1:
+            jobs = client.list_jobs_for_statuses(statuses, org_id, app_version_id,
+                                                 limit + 1, offset)
+        else:
+            result = client.list_jobs(org_id, statuses[0] if statuses else None,
+                                      app_version_id, limit + 1, offset)
+            jobs = result.get('jobs', [])
         
         if not jobs:
             print_warning("No jobs found.")
             return
         
-        # Limit results
-        jobs = jobs[:limit]
+        has_more = len(jobs) > limit
+        del jobs[limit:]
         
-        # Prepare table data
+        # Table rows are generated on demand rather than collected up front
         headers = ['Job ID', 'Org ID', 'App Version', 'Test', 'Target', 'Status', 'Created']
-        rows = []
         
-        for job in jobs:
-            payload = job.get('payload', {})
-            rows.append([
-                job.get('job_id', '')[:8] + '...',  # Truncate job ID
-                payload.get('org_id', ''),
-                payload.get('app_version_id', ''),
-                os.path.basename(payload.get('test_path', '')),
-                payload.get('target', ''),
-                format_status(job.get('status', '')),
-                job.get('created_at', '')[:19]  # Show date/time without microseconds
-            ])
+        def rows():
+            for job in jobs:
+                payload = job.get('payload', {})
+                yield (
+                    job.get('job_id', '')[:8] + '...',  # Truncate job ID
+                    payload.get('org_id', ''),
+                    payload.get('app_version_id', ''),
+                    os.path.basename(payload.get('test_path', '')),
+                    payload.get('target', ''),
+                    format_status(job.get('status', '')),
+                    job.get('created_at', '')[:19]  # Show date/time without microseconds
+                )
         
         print_info(f"Found {len(jobs)} jobs:")
-        print(tabulate(rows, headers=headers, tablefmt='grid'))
+        echo_grid(headers, rows)
         
-        if len(result.get('jobs', [])) > limit:
-            print_warning(f"Showing first {limit} jobs. Use --limit to show more.")
+        if has_more:
+            print_warning(f"Showing {limit} jobs from offset {offset}. "
+                          f"Use --limit or --offset to show more.")
             
     except Exception as e:
         print_error(str(e))
@@ -290,8 +483,6 @@ def stats():
     try:
         stats = client.get_server_stats()
         
-        print_info("Server Statistics:")
-        
         # Job statistics
         job_stats = [
             ['Total Jobs', stats.get('total_jobs', 0)],
@@ -301,9 +492,6 @@ def stats():
             ['Failed', stats.get('failed_jobs', 0)]
         ]
         
-        print("\nJob Statistics:")
-        print(tabulate(job_stats, headers=['Metric', 'Count'], tablefmt='simple'))
-        
         # Worker statistics
         worker_stats = [
             ['Total Workers', stats.get('total_workers', 0)],
@@ -311,8 +499,14 @@ def stats():
             ['Total Groups', stats.get('total_groups', 0)]
         ]
         
-        print("\nWorker Statistics:")
-        print(tabulate(worker_stats, headers=['Metric', 'Count'], tablefmt='simple'))
+        # One write for the whole report
+        click.echo("\n".join([
+            format_info("Server Statistics:"),
+            "\nJob Statistics:",
+            tabulate(job_stats, headers=['Metric', 'Count'], tablefmt='simple'),
+            "\nWorker Statistics:",
+            tabulate(worker_stats, headers=['Metric', 'Count'], tablefmt='simple'),
+        ]))
         
     except Exception as e:
         print_error(str(e))
@@ -342,84 +536,156 @@ def health():
 
 def show_job_status(client: QGJobClient, job_id: str):
     """Show detailed job status"""
+    show_job_statuses(client, [job_id])
+
+
+def show_job_statuses(client: QGJobClient, job_ids: Sequence[str]):
+    """Show detailed status for one or more jobs, fetched concurrently"""
     try:
-        job = client.get_job_status(job_id)
-        payload = job.get('payload', {})
-        
-        # Clear screen for watch mode
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/MacOS
-            os.system('clear')
-        
-        print_info(f"Job Status: {job_id}")
-        print("=" * 50)
-        
-        # Basic info
-        info_rows = [
-            ['Job ID', job.get('job_id', '')],
-            ['Status', format_status(job.get('status', ''))],
-            ['Organization', payload.get('org_id', '')],
-            ['App Version', payload.get('app_version_id', '')],
-            ['Test Path', payload.get('test_path', '')],
-            ['Target', payload.get('target', '')],
-            ['Priority', payload.get('priority', '')],
-            ['Worker ID', job.get('worker_id', 'Not assigned')],
-            ['Created', job.get('created_at', '')],
-            ['Updated', job.get('updated_at', '')],
-        ]
-        
-        if job.get('started_at'):
-            info_rows.append(['Started', job.get('started_at', '')])
-        
-        if job.get('completed_at'):
-            info_rows.append(['Completed', job.get('completed_at', '')])
-        
-        if job.get('error_message'):
-            info_rows.append(['Error', job.get('error_message', '')])
-        
-        print(tabulate(info_rows, headers=['Field', 'Value'], tablefmt='simple'))
-        
-        # Show result if available
-        if job.get('result'):
-            print_info("\nJob Result:")
-            result = job.get('result')
-            if isinstance(result, dict):
-                result_rows = [[k, v] for k, v in result.items()]
-                print(tabulate(result_rows, headers=['Key', 'Value'], tablefmt='simple'))
-            else:
-                print(result)
-                
+        draw_job_statuses(job_ids, client.get_job_statuses(job_ids))
     except Exception as e:
         print_error(str(e))
 
 
+def draw_job_statuses(job_ids: Sequence[str], jobs: Sequence[Dict[str, Any]]):
+    """Draw the details of several jobs as one screen"""
+    # The whole screen is rendered first and written at once, so a watch
+    # refresh is one write instead of one per line, and never shows a
+    # half-drawn frame
+    frame = "\n".join(format_job_details(job_id, job)
+                      for job_id, job in zip(job_ids, jobs))
+    
+    # Clear screen for watch mode; colorama translates the escape on
+    # Windows consoles, so no `clear`/`cls` subprocess is needed
+    if sys.stdout.isatty():
+        frame = CLEAR_SCREEN + frame
+    
+    click.echo(frame)
+
+
+def watch_job_events(client: QGJobClient, job_id: str) -> bool:
+    """Redraw a job's details each time the server reports a status change
+    
+    Returns True once the job finishes, or False if the server's event
+    stream is unavailable or drops so the caller can poll instead. Raises
+    JobDeletedError if the job is deleted while watched.
+    """
+    while True:
+        try:
+            events = client.stream_job_events(job_id)
+        except click.ClickException:
+            return False
+        if events is None:
+            return False
+        
+        try:
+            for job in events:
+                draw_job_statuses([job_id], [job])
+                if job.get('status', '').lower() in FINAL_STATUSES:
+                    return True
+        except requests.exceptions.RequestException:
+            return False
+        # The server closes long-lived streams; reconnect and carry on
+
+
+def format_job_details(job_id: str, job: Dict[str, Any]) -> str:
+    """Render one job's details and result as a single block of text"""
+    payload = job.get('payload', {})
+    
+    parts = [format_info(f"Job Status: {job_id}"), "=" * 50]
+    
+    # Basic info
+    info_rows = [
+        ['Job ID', job.get('job_id', '')],
+        ['Status', format_status(job.get('status', ''))],
+        ['Organization', payload.get('org_id', '')],
+        ['App Version', payload.get('app_version_id', '')],
+        ['Test Path', payload.get('test_path', '')],
+        ['Target', payload.get('target', '')],
+        ['Priority', payload.get('priority', '')],
+        ['Worker ID', job.get('worker_id', 'Not assigned')],
+        ['Created', job.get('created_at', '')],
+        ['Updated', job.get('updated_at', '')],
+    ]
+    
+    if job.get('started_at'):
+        info_rows.append(['Started', job.get('started_at', '')])
+    
+    if job.get('completed_at'):
+        info_rows.append(['Completed', job.get('completed_at', '')])
+    
+    if job.get('error_message'):
+        info_rows.append(['Error', job.get('error_message', '')])
+    
+    parts.append(tabulate(info_rows, headers=['Field', 'Value'], tablefmt='simple'))
+    
+    # Show result if available
+    if job.get('result'):
+        parts.append(format_info("\nJob Result:"))
+        result = job.get('result')
+        if isinstance(result, dict):
+            result_rows = [[k, v] for k, v in result.items()]
+            parts.append(tabulate(result_rows, headers=['Key', 'Value'], tablefmt='simple'))
+        else:
+            parts.append(str(result))
+    
+    return "\n".join(parts)
+
+
+def report_final_status(job: Dict[str, Any]) -> bool:
+    """Report a finished job's outcome; returns False if it is still in progress"""
+    status = job.get('status', '').lower()
+    
+    if status not in FINAL_STATUSES:
+        return False
+    
+    print_info(f"\nJob finished with status: {format_status(status)}")
+    
+    if status == 'completed':
+        print_success("Job completed successfully!")
+        if job.get('result'):
+            print_info("Result:")
+            print(job.get('result'))
+    elif status == 'failed':
+        print_error("Job failed!")
+        if job.get('error_message'):
+            print_error(f"Error: {job.get('error_message')}")
+        sys.exit(1)
+    elif status == 'cancelled':
+        print_warning("Job was cancelled.")
+        sys.exit(1)
+    return True
+
+
 def wait_for_completion(client: QGJobClient, job_id: str, poll_interval: int):
-    """Wait for job completion and show final result"""
+    """Wait for job completion and show final result
+    
+    Follows the server's event stream when it has one, so the result shows
+    as soon as the job finishes; older or busy servers are polled instead.
+    """
     try:
         while True:
-            job = client.get_job_status(job_id)
-            status = job.get('status', '').lower()
+            events = client.stream_job_events(job_id)
+            if events is None:
+                break
             
-            if status in ['completed', 'failed', 'cancelled']:
-                print_info(f"\nJob finished with status: {format_status(status)}")
-                
-                if status == 'completed':
-                    print_success("Job completed successfully!")
-                    if job.get('result'):
-                        print_info("Result:")
-                        print(job.get('result'))
-                elif status == 'failed':
-                    print_error("Job failed!")
-                    if job.get('error_message'):
-                        print_error(f"Error: {job.get('error_message')}")
-                    sys.exit(1)
-                elif status == 'cancelled':
-                    print_warning("Job was cancelled.")
-                    sys.exit(1)
+            try:
+                for job in events:
+                    if report_final_status(job):
+                        return
+                    print_info(f"Status: {format_status(job.get('status', ''))} (waiting...)")
+            except requests.exceptions.RequestException:
+                # The stream dropped mid-way; poll instead
+                break
+            # The server closes long-lived streams; reconnect and carry on
+        
+        print_info(f"Polling job status every {poll_interval}s...")
+        while True:
+            job = client.get_job_status(job_id)
+            if report_final_status(job):
                 break
             
-            print_info(f"Status: {format_status(status)} (waiting...)")
+            print_info(f"Status: {format_status(job.get('status', ''))} (waiting...)")
             time.sleep(poll_interval)
             
     except KeyboardInterrupt:
@@ -10,6 +10,7 @@ setup(
     install_requires=[
         "click>=8.0.0",
         "requests>=2.25.0",
+        "orjson>=3.6.0",
         "colorama>=0.4.4",
         "tabulate>=0.9.0",
         "python-dotenv>=0.19.0",
@@ -6,6 +6,8 @@ from .schemas import (
     JobStatus,
     JobTarget, 
     JobPriority,
+    TARGET_BITS,
+    PRIORITY_WEIGHTS,
     JobPayload,
     Job,
     JobGroup,
@@ -19,6 +21,8 @@ __all__ = [
     "JobStatus",
     "JobTarget", 
     "JobPriority",
+    "TARGET_BITS",
+    "PRIORITY_WEIGHTS",
     "JobPayload",
     "Job",
     "JobGroup",
@@ -7,9 +7,28 @@ the CLI tool and backend service.
 
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-import uuid
+from operator import attrgetter
+import os
+import threading
+
+
+def _add_slots(cls):
+    """Recreate a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)
+    
+    Records are built by the thousand and serialized on every list request, so
+    dropping the per-instance __dict__ saves memory and speeds attribute access.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    # Field defaults live in the generated __init__, not as class attributes
+    for name in field_names + ("__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
 
 
 class JobStatus(Enum):
@@ -29,6 +48,18 @@ class JobTarget(Enum):
     BROWSERSTACK = "browserstack"
 
 
+# One bit per target so worker/job compatibility is a single `&` test
+TARGET_BITS = {target: 1 << i for i, target in enumerate(JobTarget)}
+
+
+def targets_to_mask(targets) -> int:
+    """Combine targets into a TARGET_BITS mask"""
+    mask = 0
+    for target in targets:
+        mask |= TARGET_BITS[target]
+    return mask
+
+
 class JobPriority(Enum):
     """Job priority enumeration"""
     LOW = "low"
@@ -37,6 +68,32 @@ class JobPriority(Enum):
     URGENT = "urgent"
 
 
+# Scheduling weight per priority (higher runs first); the values themselves
+# do not sort by urgency
+PRIORITY_WEIGHTS = {
+    JobPriority.URGENT: 4,
+    JobPriority.HIGH: 3,
+    JobPriority.NORMAL: 2,
+    JobPriority.LOW: 1
+}
+
+
+# Serializers read member._value_ directly: `.value` goes through Enum's
+# descriptor on every access, and the value strings are already interned
+# literals. Going the other way, plain dicts skip EnumMeta.__call__.
+_TARGET_BY_VALUE = {t._value_: t for t in JobTarget}
+_PRIORITY_BY_VALUE = {p._value_: p for p in JobPriority}
+
+
+def _member(members: Dict[Any, Enum], value: Any, name: str) -> Enum:
+    """Look up an enum member by value, raising ValueError if there is none"""
+    try:
+        return members[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid {name}: {value!r}") from None
+
+
+@_add_slots
 @dataclass
 class JobPayload:
     """Job submission payload schema"""
@@ -46,17 +103,34 @@ class JobPayload:
     target: JobTarget = JobTarget.EMULATOR
     priority: JobPriority = JobPriority.NORMAL
     metadata: Dict[str, Any] = field(default_factory=dict)
+    target_mask: int = field(init=False, repr=False, compare=False)
+    priority_weight: int = field(init=False, repr=False, compare=False)
+    # to_dict's fields; a payload is never modified once submitted, so they
+    # are built on first use and copied out by every serialization after that
+    _dict: Optional[Dict[str, Any]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.target_mask = TARGET_BITS[self.target]
+        self.priority_weight = PRIORITY_WEIGHTS[self.priority]
+        self._dict = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "org_id": self.org_id,
-            "app_version_id": self.app_version_id,
-            "test_path": self.test_path,
-            "target": self.target.value,
-            "priority": self.priority.value,
-            "metadata": self.metadata
-        }
+        """Convert to dictionary for JSON serialization
+        
+        Each call returns a new dict, so callers may modify it without touching
+        the cached copy. As before caching, `metadata` is the payload's own dict.
+        """
+        if self._dict is None:
+            org_id, app_version_id, test_path, target, priority, metadata = _PAYLOAD_FIELDS(self)
+            self._dict = {
+                "org_id": org_id,
+                "app_version_id": app_version_id,
+                "test_path": test_path,
+                "target": target._value_,
+                "priority": priority._value_,
+                "metadata": metadata
+            }
+        return dict(self._dict)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'JobPayload':
@@ -65,12 +139,13 @@ class JobPayload:
             org_id=data["org_id"],
             app_version_id=data["app_version_id"],
             test_path=data["test_path"],
-            target=JobTarget(data.get("target", "emulator")),
-            priority=JobPriority(data.get("priority", "normal")),
+            target=_member(_TARGET_BY_VALUE, data.get("target", "emulator"), "target"),
+            priority=_member(_PRIORITY_BY_VALUE, data.get("priority", "normal"), "priority"),
             metadata=data.get("metadata", {})
         )
 
 
+@_add_slots
 @dataclass
 class Job:
     """Complete job record"""
@@ -78,7 +153,8 @@ class Job:
     payload: JobPayload
     status: JobStatus = JobStatus.PENDING
     created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Defaults to created_at, so a new record reads the clock once
+    updated_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     worker_id: Optional[str] = None
@@ -86,32 +162,57 @@ class Job:
     error_message: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    # Timestamp name -> (datetime, its isoformat()); an entry is only used
+    # while the attribute still holds that same datetime object
+    _iso_cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False,
+                                       compare=False)
+    
+    def __post_init__(self):
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+    
+    def _iso(self, name: str, value: Optional[datetime]) -> Optional[str]:
+        """isoformat() of timestamp `name`, reused across serializations"""
+        if value is None:
+            return None
+        cached = self._iso_cache.get(name)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        text = value.isoformat()
+        self._iso_cache[name] = (value, text)
+        return text
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        (job_id, payload, status, created_at, updated_at, started_at, completed_at,
+         worker_id, result, error_message, retry_count, max_retries) = _JOB_FIELDS(self)
+        iso = self._iso
         return {
-            "job_id": self.job_id,
-            "payload": self.payload.to_dict(),
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "worker_id": self.worker_id,
-            "result": self.result,
-            "error_message": self.error_message,
-            "retry_count": self.retry_count,
-            "max_retries": self.max_retries
+            "job_id": job_id,
+            "payload": payload.to_dict(),
+            "status": status._value_,
+            "created_at": iso("created_at", created_at),
+            "updated_at": iso("updated_at", updated_at),
+            "started_at": iso("started_at", started_at),
+            "completed_at": iso("completed_at", completed_at),
+            "worker_id": worker_id,
+            "result": result,
+            "error_message": error_message,
+            "retry_count": retry_count,
+            "max_retries": max_retries
         }
 
 
+@_add_slots
 @dataclass
 class JobGroup:
     """Group of jobs sharing the same app_version_id"""
     group_id: str
     org_id: str
     app_version_id: str
-    jobs: List[str] = field(default_factory=list)  # job_ids
+    # job_ids, as an insertion-ordered set: O(1) membership and removal,
+    # while the first job still stands in for the group's target
+    jobs: Dict[str, None] = field(default_factory=dict)
     status: JobStatus = JobStatus.PENDING
     created_at: datetime = field(default_factory=datetime.utcnow)
     assigned_worker: Optional[str] = None
@@ -122,13 +223,14 @@ class JobGroup:
             "group_id": self.group_id,
             "org_id": self.org_id,
             "app_version_id": self.app_version_id,
-            "jobs": self.jobs,
-            "status": self.status.value,
+            "jobs": [*self.jobs],
+            "status": self.status._value_,
             "created_at": self.created_at.isoformat(),
             "assigned_worker": self.assigned_worker
         }
 
 
+@_add_slots
 @dataclass
 class Worker:
     """Worker/Agent representation"""
@@ -136,33 +238,96 @@ class Worker:
     name: str
     target_types: List[JobTarget]
     status: str = "idle"  # idle, busy, offline
-    current_jobs: List[str] = field(default_factory=list)
+    # job_ids, as an insertion-ordered set like JobGroup.jobs
+    current_jobs: Dict[str, None] = field(default_factory=dict)
     last_heartbeat: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    target_mask: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.target_mask = targets_to_mask(self.target_types)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        (worker_id, name, target_types, status, current_jobs,
+         last_heartbeat, metadata) = _WORKER_FIELDS(self)
         return {
-            "worker_id": self.worker_id,
-            "name": self.name,
-            "target_types": [t.value for t in self.target_types],
-            "status": self.status,
-            "current_jobs": self.current_jobs,
-            "last_heartbeat": self.last_heartbeat.isoformat(),
-            "metadata": self.metadata
+            "worker_id": worker_id,
+            "name": name,
+            "target_types": [t._value_ for t in target_types],
+            "status": status,
+            "current_jobs": [*current_jobs],
+            "last_heartbeat": last_heartbeat.isoformat(),
+            "metadata": metadata
         }
 
 
+# Fetch every serialized field in one C call instead of one lookup per field
+_PAYLOAD_FIELDS = attrgetter("org_id", "app_version_id", "test_path", "target", "priority", "metadata")
+_JOB_FIELDS = attrgetter("job_id", "payload", "status", "created_at", "updated_at", "started_at",
+                         "completed_at", "worker_id", "result", "error_message", "retry_count",
+                         "max_retries")
+_WORKER_FIELDS = attrgetter("worker_id", "name", "target_types", "status", "current_jobs",
+                            "last_heartbeat", "metadata")
+
+
+# Random bytes fetched from the OS per refill of an ID pool
+_ID_POOL_BYTES = 16 * 4096
+
+# UUID4 variant digit for each random hex digit (top bits forced to 10)
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+class _IdPool:
+    """Hex digits from one bulk os.urandom read, handed out a slice at a time"""
+    __slots__ = ("digits", "offset")
+    
+    def __init__(self):
+        self.digits = ""
+        self.offset = 0
+    
+    def take(self, count: int) -> str:
+        """Return the next `count` random hex digits"""
+        offset = self.offset
+        if offset + count > len(self.digits):
+            self.digits = os.urandom(_ID_POOL_BYTES).hex()
+            offset = 0
+        self.offset = offset + count
+        return self.digits[offset:offset + count]
+
+
+_id_pools = threading.local()
+
+
+def _random_hex(count: int) -> str:
+    """Random hex digits from this thread's pool"""
+    pool = getattr(_id_pools, "pool", None)
+    if pool is None:
+        pool = _id_pools.pool = _IdPool()
+    return pool.take(count)
+
+
+def _reset_id_pools() -> None:
+    """Drop pools inherited across fork so parent and child never share IDs"""
+    global _id_pools
+    _id_pools = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pools)
+
+
 def generate_job_id() -> str:
-    """Generate a unique job ID"""
-    return str(uuid.uuid4())
+    """Generate a unique job ID (a random UUID4 string)"""
+    h = _random_hex(32)
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
 
 
 def generate_group_id() -> str:
     """Generate a unique group ID"""
-    return f"group-{str(uuid.uuid4())[:8]}"
+    return f"group-{_random_hex(8)}"
 
 
 def generate_worker_id() -> str:
     """Generate a unique worker ID"""
-    return f"worker-{str(uuid.uuid4())[:8]}" 
\ No newline at end of file
+    return f"worker-{_random_hex(8)}" 
\ No newline at end of file
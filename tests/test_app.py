@@ -0,0 +1,127 @@
+"""
+Tests for the REST API, run against the in-memory store
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault('ENVIRONMENT', 'development')
+
+from backend import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def worker_id(client):
+    response = client.post('/workers', json={'name': 'w', 'target_types': ['emulator']})
+    return response.get_json()['worker_id']
+
+
+@pytest.mark.parametrize('wait', ['nan', 'inf', '-inf'])
+def test_heartbeat_rejects_non_finite_wait(client, worker_id, wait):
+    response = client.post(f'/workers/{worker_id}/heartbeat?wait={wait}')
+    assert response.status_code == 400
+
+
+def test_heartbeat_accepts_finite_wait(client, worker_id):
+    response = client.post(f'/workers/{worker_id}/heartbeat?wait=0')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ok'
+
+
+def test_heartbeat_waiters_capped(client, worker_id, monkeypatch):
+    """With every wait slot taken, a long-poll heartbeat answers at once"""
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(app_module, '_heartbeat_wait_slots', slots)
+    slots.acquire()
+
+    started = time.monotonic()
+    response = client.post(f'/workers/{worker_id}/heartbeat?wait=5')
+    assert response.status_code == 200
+    assert time.monotonic() - started < 1
+
+    slots.release()
+    started = time.monotonic()
+    client.post(f'/workers/{worker_id}/heartbeat?wait=0.3')
+    assert time.monotonic() - started >= 0.3
+    # The slot is handed back once the wait ends
+    assert slots.acquire(blocking=False)
+
+
+def test_job_events_capped_at_max_streams(client, monkeypatch):
+    """Streams past the cap get a 503, and closing one frees its slot"""
+    monkeypatch.setattr(app_module, '_job_event_slots', threading.BoundedSemaphore(1))
+    job_id = client.post('/jobs', json={
+        'org_id': 'o', 'app_version_id': 'v', 'test_path': 't'
+    }).get_json()['job_id']
+
+    first = client.get(f'/jobs/{job_id}/events', buffered=False)
+    assert first.status_code == 200
+    assert client.get(f'/jobs/{job_id}/events').status_code == 503
+
+    first.close()
+    second = client.get(f'/jobs/{job_id}/events', buffered=False)
+    assert second.status_code == 200
+    second.close()
+
+
+@pytest.mark.parametrize('body', [
+    {'org_id': 'o', 'app_version_id': 'v', 'test_path': 't', 'target': 'phone'},
+    {'org_id': 'o', 'app_version_id': 'v', 'test_path': 't', 'priority': 'asap'},
+    {'org_id': 'o', 'app_version_id': 'v'},
+])
+def test_submit_job_rejects_invalid_payload(client, body):
+    response = client.post('/jobs', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_bulk_submit_names_the_bad_entry(client):
+    response = client.post('/jobs/bulk', json=[
+        {'org_id': 'o', 'app_version_id': 'v', 'test_path': 't'},
+        {'org_id': 'o', 'app_version_id': 'v', 'test_path': 't', 'target': 'phone'},
+    ])
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith('Job 1:')
+
+
+def test_invalid_enum_values_are_rejected(client):
+    job_id = client.post('/jobs', json={
+        'org_id': 'o', 'app_version_id': 'v', 'test_path': 't'
+    }).get_json()['job_id']
+
+    assert client.put(f'/jobs/{job_id}', json={'status': 'done'}).status_code == 400
+    assert client.get('/jobs?status=done').status_code == 400
+    assert client.get('/jobs?target=phone').status_code == 400
+    response = client.post('/workers', json={'name': 'w', 'target_types': ['phone']})
+    assert response.status_code == 400
+
+
+def test_unhandled_key_error_is_a_server_error(client, monkeypatch):
+    """A KeyError from a bug is reported as a 500, not blamed on the request"""
+    def broken_list_groups(org_id=None, status=None):
+        raise KeyError('oops')
+    monkeypatch.setattr(app_module.job_store, 'list_groups', broken_list_groups)
+    assert client.get('/groups').status_code == 500
+
+
+def test_bad_paging_and_bulk_bodies_are_rejected(client):
+    assert client.get('/jobs?offset=-1').status_code == 400
+    response = client.post('/jobs/bulk', data=b'{"org_id": \n',
+                           content_type='application/x-ndjson')
+    assert response.status_code == 400
+
+
+def test_unhandled_value_error_is_a_server_error(client, monkeypatch):
+    """A ValueError from a bug is reported as a 500, not blamed on the request"""
+    def broken_list_groups(org_id=None, status=None):
+        raise ValueError('Invalid isoformat string')
+    monkeypatch.setattr(app_module.job_store, 'list_groups', broken_list_groups)
+    assert client.get('/groups').status_code == 500
@@ -0,0 +1,58 @@
+"""
+Tests for the CLI's job event handling
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'cli'))
+
+from qgjob import cli  # noqa: E402
+
+
+class FakeStream:
+    """Event stream response that yields `lines`, then raises `error` if given"""
+
+    def __init__(self, lines, error=None):
+        self.lines = lines
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_lines(self, decode_unicode=False):
+        yield from self.lines
+        if self.error:
+            raise self.error
+
+
+class FakeClient:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def stream_job_events(self, job_id):
+        return cli.QGJobClient._iter_status_events(self.stream)
+
+
+@pytest.fixture(autouse=True)
+def no_drawing(monkeypatch):
+    monkeypatch.setattr(cli, 'draw_job_statuses', lambda job_ids, jobs: None)
+
+
+def test_watch_falls_back_to_polling_when_stream_drops():
+    stream = FakeStream(['event: status', 'data: {"status": "running"}', ''],
+                        error=requests.exceptions.ChunkedEncodingError('dropped'))
+    assert cli.watch_job_events(FakeClient(stream), 'job-1') is False
+
+
+def test_watch_stops_when_job_is_deleted():
+    stream = FakeStream(['event: status', 'data: {"status": "running"}', '',
+                         'event: deleted', 'data: {}', ''])
+    with pytest.raises(cli.JobDeletedError):
+        cli.watch_job_events(FakeClient(stream), 'job-1')
@@ -0,0 +1,103 @@
+"""
+Tests run against both job stores
+"""
+
+from datetime import datetime, timedelta
+
+import fakeredis
+import pytest
+import redis
+
+from backend.job_store import JobStore
+from backend.redis_job_store import RedisJobStore
+from shared import Job, JobPayload, JobTarget, Worker
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request, monkeypatch):
+    if request.param == "memory":
+        return JobStore()
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis, "from_url",
+                        lambda *args, **kwargs: fakeredis.FakeRedis(server=server,
+                                                                    decode_responses=True))
+    return RedisJobStore("redis://test")
+
+
+def make_job(index: int, created_at: datetime, target=JobTarget.EMULATOR) -> Job:
+    payload = JobPayload(org_id="org", app_version_id="v1", test_path=f"t{index}", target=target)
+    return Job(job_id=f"job-{index:02d}", payload=payload, created_at=created_at)
+
+
+def test_list_jobs_pages_in_created_order(store):
+    """Pages are disjoint, stable and together cover the listing oldest first"""
+    start = datetime(2024, 1, 1)
+    # Added out of order so insertion order differs from creation order
+    indexes = [7, 2, 9, 0, 5, 3, 8, 1, 6, 4]
+    for index in indexes:
+        store.add_job(make_job(index, start + timedelta(seconds=index)))
+    expected = [f"job-{index:02d}" for index in range(10)]
+
+    for filters in ({}, {"org_id": "org"}, {"org_id": "org", "app_version_id": "v1"}):
+        pages = [[job.job_id for job in store.list_jobs(offset=offset, limit=3, **filters)]
+                 for offset in range(0, 10, 3)]
+        assert [job_id for page in pages for job_id in page] == expected
+        assert [job.job_id for job in store.list_jobs(offset=3, limit=3, **filters)] == pages[1]
+
+
+def test_list_jobs_filters_by_target(store):
+    start = datetime(2024, 1, 1)
+    store.add_job(make_job(0, start, JobTarget.EMULATOR))
+    store.add_job(make_job(1, start + timedelta(seconds=1), JobTarget.DEVICE))
+    store.add_job(make_job(2, start + timedelta(seconds=2), JobTarget.EMULATOR))
+
+    emulator_jobs = store.list_jobs(target=JobTarget.EMULATOR)
+    assert [job.job_id for job in emulator_jobs] == ["job-00", "job-02"]
+
+    store.delete_job("job-00")
+    assert [job.job_id for job in store.list_jobs(target=JobTarget.EMULATOR)] == ["job-02"]
+
+
+def test_clear_all_drops_target_index(store):
+    if not hasattr(store, "clear_all"):
+        pytest.skip("only RedisJobStore has clear_all")
+    store.add_job(make_job(0, datetime(2024, 1, 1)))
+    store.clear_all()
+    assert store.redis.keys(f"{store.JOB_TARGET_INDEX}*") == []
+    assert store.list_jobs(target=JobTarget.EMULATOR) == []
+
+
+def test_job_is_assigned_once(store):
+    """A second assignment, as from a racing scheduler, changes nothing"""
+    store.add_job(make_job(0, datetime(2024, 1, 1)))
+    for worker_id in ("w1", "w2"):
+        store.add_worker(Worker(worker_id=worker_id, name=worker_id,
+                                target_types=[JobTarget.EMULATOR]))
+
+    assert store.assign_jobs_to_worker(["job-00"], "w1") == ["job-00"]
+    assert store.assign_jobs_to_worker(["job-00"], "w2") == []
+    assert not store.assign_job_to_worker("job-00", "w2")
+
+    assert store.get_job("job-00").worker_id == "w1"
+    assert [w.worker_id for w in store.get_available_workers(JobTarget.EMULATOR)] == ["w2"]
+    stats = store.get_queue_stats()
+    assert (stats["queued"], stats["pending"]) == (1, 0)
+    assert (stats["busy_workers"], stats["idle_workers"]) == (1, 1)
+
+    assert store.complete_job_for_worker("job-00", "w1")
+    available = {w.worker_id for w in store.get_available_workers(JobTarget.EMULATOR)}
+    assert available == {"w1", "w2"}
+    assert store.get_available_workers(JobTarget.DEVICE) == []
+
+
+def test_list_jobs_pages_jobs_created_together(store):
+    """Jobs sharing a created_at, as in one bulk batch, page by job id"""
+    created_at = datetime(2024, 1, 1)
+    indexes = [7, 2, 9, 0, 5, 3, 8, 1, 6, 4]
+    store.add_jobs([make_job(index, created_at) for index in indexes])
+    expected = [f"job-{index:02d}" for index in range(10)]
+
+    for filters in ({}, {"org_id": "org"}, {"org_id": "org", "app_version_id": "v1"}):
+        pages = [[job.job_id for job in store.list_jobs(offset=offset, limit=3, **filters)]
+                 for offset in range(0, 10, 3)]
+        assert [job_id for page in pages for job_id in page] == expected
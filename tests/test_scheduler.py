@@ -0,0 +1,36 @@
+"""
+Tests for the scheduler loop
+"""
+
+import time
+
+from backend.job_store import JobStore
+from backend.scheduler import JobScheduler
+
+
+class FailingJobStore(JobStore):
+    """In-memory store whose group listing fails, as if the backend were down"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def list_groups(self, org_id=None, status=None):
+        self.calls += 1
+        raise ConnectionError("store unavailable")
+
+
+def test_failing_passes_back_off():
+    """A pass that keeps raising waits schedule_interval instead of spinning"""
+    store = FailingJobStore()
+    scheduler = JobScheduler(store)
+    scheduler.schedule_interval = 0.1
+
+    scheduler.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        scheduler.stop()
+
+    # About five passes fit in 0.5s; an unthrottled loop runs thousands
+    assert 1 <= store.calls <= 10
@@ -0,0 +1,17 @@
+"""
+Tests for the shared schemas
+"""
+
+from shared import Job, JobPayload
+
+
+def test_payload_to_dict_is_not_shared():
+    """Changing one serialization leaves the payload's later ones intact"""
+    payload = JobPayload(org_id="org", app_version_id="v1", test_path="t")
+    job = Job(job_id="job-1", payload=payload)
+
+    job.to_dict()["payload"]["org_id"] = "other"
+    payload.to_dict()["target"] = "device"
+
+    assert payload.to_dict()["org_id"] == "org"
+    assert job.to_dict()["payload"]["target"] == "emulator"